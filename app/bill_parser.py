@@ -238,6 +238,9 @@ class BillData:
     standing_charge_total: Optional[float] = None
     discount: Optional[float] = None
     pso_levy: Optional[float] = None
+    # Stored as printed, not derived from the lines above: which charges,
+    # credits and levies it includes varies by supplier, and the VAT
+    # cross-check in compute_warnings() needs the bill's own figure.
     subtotal_before_vat: Optional[float] = None
     vat_rate_pct: Optional[float] = None
     vat_amount: Optional[float] = None
@@ -0,0 +1,204 @@
+"""Excel export for Energy Insight bills.
+
+Builds the single-bill and comparison workbooks offered for download on
+the Bill Extractor page.
+"""
+from __future__ import annotations
+
+import io
+from dataclasses import fields as dataclass_fields
+
+import pandas as pd
+
+from bill_parser import BillData
+from common.formatters import format_warnings
+
+
+# Extraction metadata, shown separately from the extracted bill fields.
+SKIP_META = frozenset({'extraction_method', 'confidence_score', 'warnings'})
+# BillData field names in declaration order, minus the metadata.
+SUMMARY_FIELDS = tuple(
+    f.name for f in dataclass_fields(BillData) if f.name not in SKIP_META
+)
+# Title-cased labels for SUMMARY_FIELDS, as on the comparison bill sheets.
+SUMMARY_TITLES = tuple(name.replace('_', ' ').title() for name in SUMMARY_FIELDS)
+
+
+def count_extracted_fields(bill: BillData) -> int:
+    """Count the number of non-None extracted fields."""
+    return sum(1 for name in SUMMARY_FIELDS if getattr(bill, name) is not None)
+
+
+# xlsxwriter otherwise spools every worksheet through a temp file before
+# zipping; these workbooks are a few dozen rows, so build them in memory.
+# Don't add constant_memory: pandas and write_field_sheet both write column
+# by column, and that mode silently drops any cell written to a row it has
+# already flushed. in_memory would override it anyway.
+XLSX_ENGINE_KWARGS = {'options': {'in_memory': True}}
+
+
+# Bill Summary labels, with units and acronyms spelled out.
+EXCEL_FIELD_LABELS = {
+    'supplier': 'Supplier',
+    'customer_name': 'Customer Name',
+    'premises': 'Premises',
+    'mprn': 'MPRN',
+    'account_number': 'Account Number',
+    'invoice_number': 'Invoice Number',
+    'meter_number': 'Meter Number',
+    'dg_code': 'DG Code',
+    'mcc_code': 'MCC Code',
+    'bill_date': 'Bill Date',
+    'billing_period_start': 'Billing Period Start',
+    'billing_period_end': 'Billing Period End',
+    'payment_due_date': 'Payment Due Date',
+    'contract_end_date': 'Contract End Date',
+    'ceg_export_start': 'CEG Export Start',
+    'ceg_export_end': 'CEG Export End',
+    'day_units_kwh': 'Day Units (kWh)',
+    'night_units_kwh': 'Night Units (kWh)',
+    'peak_units_kwh': 'Peak Units (kWh)',
+    'total_units_kwh': 'Total Units (kWh)',
+    'day_rate': 'Day Rate (EUR/kWh)',
+    'night_rate': 'Night Rate (EUR/kWh)',
+    'peak_rate': 'Peak Rate (EUR/kWh)',
+    'day_cost': 'Day Cost (EUR)',
+    'night_cost': 'Night Cost (EUR)',
+    'peak_cost': 'Peak Cost (EUR)',
+    'standing_charge_days': 'Standing Charge Days',
+    'standing_charge_rate': 'Standing Charge Rate (EUR/day)',
+    'standing_charge_total': 'Standing Charge Total (EUR)',
+    'discount': 'Discount (EUR)',
+    'pso_levy': 'PSO Levy (EUR)',
+    'subtotal_before_vat': 'Subtotal Before VAT (EUR)',
+    'vat_rate_pct': 'VAT Rate (%)',
+    'vat_amount': 'VAT Amount (EUR)',
+    'total_this_period': 'Total This Period (EUR)',
+    'export_units': 'Export Units (kWh)',
+    'export_rate': 'Export Rate (EUR/kWh)',
+    'export_credit': 'Export Credit (EUR)',
+    'previous_balance': 'Previous Balance (EUR)',
+    'payments_received': 'Payments Received (EUR)',
+    'amount_due': 'Amount Due (EUR)',
+    'tariff_type': 'Tariff Type',
+    'eab_current': 'Current EAB (EUR)',
+    'eab_new': 'New EAB (EUR)',
+}
+# Bill Summary row labels, aligned with SUMMARY_FIELDS.
+EXCEL_SUMMARY_LABELS = tuple(
+    EXCEL_FIELD_LABELS.get(name, name.replace('_', ' ').title())
+    for name in SUMMARY_FIELDS
+)
+
+
+def write_field_sheet(book, sheet_name: str, fields, values):
+    """Add a two-column Field/Value worksheet to an xlsxwriter workbook.
+
+    Writes whole columns directly rather than going through a DataFrame
+    and pandas' cell-by-cell ExcelFormatter.
+    """
+    ws = book.add_worksheet(sheet_name)
+    ws.write_row(0, 0, ('Field', 'Value'))
+    ws.write_column(1, 0, fields)
+    ws.write_column(1, 1, values)
+
+
+def generate_bill_excel(bill: BillData) -> io.BytesIO:
+    """Generate an Excel file from extracted bill data."""
+    buffer = io.BytesIO()
+
+    with pd.ExcelWriter(buffer, engine='xlsxwriter',
+                        engine_kwargs=XLSX_ENGINE_KWARGS) as writer:
+        # Sheet 1: Bill Summary
+        write_field_sheet(
+            writer.book, 'Bill Summary', EXCEL_SUMMARY_LABELS,
+            [getattr(bill, name) for name in SUMMARY_FIELDS],
+        )
+
+        # Sheet 2: Extraction Metadata
+        write_field_sheet(
+            writer.book, 'Extraction Metadata',
+            ('Extraction Method', 'Confidence Score', 'Warnings',
+             'Supplier Detected'),
+            (bill.extraction_method,
+             f"{bill.confidence_score:.1%}",
+             format_warnings(bill.warnings),
+             bill.supplier or 'Unknown'),
+        )
+
+    buffer.seek(0)
+    return buffer
+
+
+def generate_comparison_excel(df: pd.DataFrame, bills) -> io.BytesIO:
+    """Generate Excel comparison workbook with computed columns and totals."""
+    buffer = io.BytesIO()
+
+    with pd.ExcelWriter(buffer, engine='xlsxwriter',
+                        engine_kwargs=XLSX_ENGINE_KWARGS) as writer:
+        # Summary sheet — includes computed columns
+        summary_cols = [
+            'filename', 'supplier', 'mprn', 'bill_date', 'billing_period',
+            'billing_days', 'total_kwh', 'day_kwh', 'night_kwh', 'peak_kwh',
+            'day_rate', 'night_rate', 'peak_rate',
+            'standing_charge', 'standing_charge_rate',
+            'subtotal', 'vat', 'total_cost', 'amount_due',
+            'cost_per_day', 'kwh_per_day', 'effective_rate', 'annualised_cost',
+        ]
+        summary_labels = {
+            'filename': 'File', 'supplier': 'Supplier', 'mprn': 'MPRN',
+            'bill_date': 'Bill Date', 'billing_period': 'Billing Period',
+            'billing_days': 'Billing Days',
+            'total_kwh': 'Total kWh', 'day_kwh': 'Day kWh',
+            'night_kwh': 'Night kWh', 'peak_kwh': 'Peak kWh',
+            'day_rate': 'Day Rate (\u20ac/kWh)', 'night_rate': 'Night Rate (\u20ac/kWh)',
+            'peak_rate': 'Peak Rate (\u20ac/kWh)',
+            'standing_charge': 'Standing Charge (\u20ac)',
+            'standing_charge_rate': 'Standing \u20ac/day',
+            'subtotal': 'Subtotal (\u20ac)',
+            'vat': 'VAT (\u20ac)', 'total_cost': 'Total Cost (\u20ac)',
+            'amount_due': 'Amount Due (\u20ac)',
+            'cost_per_day': 'Cost/Day (\u20ac)',
+            'kwh_per_day': 'kWh/Day',
+            'effective_rate': 'Effective \u20ac/kWh',
+            'annualised_cost': 'Annualised Cost (\u20ac)',
+        }
+
+        available = [c for c in summary_cols if c in df.columns]
+        df[available].to_excel(
+            writer, sheet_name='Comparison', index=False,
+            header=[summary_labels[c] for c in available],
+        )
+
+        # Totals/averages row, written straight under the data rather than
+        # concatenated onto a copy of the frame
+        totals = []
+        for col in available:
+            if col in ('filename',):
+                totals.append('TOTAL / AVG')
+            elif col in ('supplier', 'mprn', 'bill_date', 'billing_period'):
+                totals.append('')
+            elif col in ('total_kwh', 'day_kwh', 'night_kwh', 'peak_kwh',
+                         'standing_charge', 'subtotal', 'vat', 'total_cost',
+                         'amount_due', 'billing_days'):
+                totals.append(df[col].sum() if df[col].notna().any() else None)
+            elif col in ('day_rate', 'night_rate', 'peak_rate',
+                         'standing_charge_rate', 'cost_per_day', 'kwh_per_day',
+                         'effective_rate', 'annualised_cost'):
+                totals.append(df[col].mean() if df[col].notna().any() else None)
+        writer.sheets['Comparison'].write_row(len(df) + 1, 0, totals)
+
+        # Individual bill sheets
+        for bill, filename in bills:
+            bill_rows = [
+                (title, getattr(bill, name))
+                for name, title in zip(SUMMARY_FIELDS, SUMMARY_TITLES)
+            ]
+            # Excel sheet name max 31 chars
+            sheet_name = filename[:31].replace('/', '-').replace('\\', '-')
+            pd.DataFrame(bill_rows, columns=['Field', 'Value']).to_excel(
+                writer, sheet_name=sheet_name, index=False,
+            )
+
+    buffer.seek(0)
+    return buffer
@@ -4,7 +4,11 @@ Currency, kWh, percentage, and date formatting helpers used across pages.
 """
 from __future__ import annotations
 
+from collections import Counter
 from datetime import date, datetime as dt
+from functools import lru_cache
+
+import pandas as pd
 
 
 def format_currency(value: float | None, symbol: str = "\u20ac") -> str:
@@ -35,6 +39,16 @@ def format_percentage(value: float | None) -> str:
     return f"{value:.1f}%"
 
 
+def format_warnings(warnings: list[str]) -> str:
+    """Join extraction warnings with semicolons, or return 'None' if empty."""
+    n = len(warnings)
+    if n == 0:
+        return "None"
+    if n == 1:
+        return warnings[0]
+    return "; ".join(warnings)
+
+
 def format_date_range(start: str | None, end: str | None) -> str:
     """Format a billing period date range."""
     if start and end:
@@ -44,19 +58,23 @@ def format_date_range(start: str | None, end: str | None) -> str:
     return "\u2014"
 
 
+_BILL_DATE_FORMATS = (
+    "%d/%m/%Y", "%d %b %Y", "%d %B %Y", "%d.%m.%Y",
+    "%Y-%m-%d", "%d-%m-%Y",
+    "%d/%m/%y", "%d-%m-%y", "%d.%m.%y", "%d %b %y", "%d %B %y",
+)
+
+
+@lru_cache(maxsize=1024)
 def parse_bill_date(date_str: str | None):
     """Try to parse a date string from bill extraction.
 
-    Returns a date object or None.
+    Returns a date object or None.  Results are cached: the same few date
+    strings are re-parsed for every bill on every comparison rerun.
     """
     if not date_str:
         return None
-    formats = [
-        "%d/%m/%Y", "%d %b %Y", "%d %B %Y", "%d.%m.%Y",
-        "%Y-%m-%d", "%d-%m-%Y",
-        "%d/%m/%y", "%d-%m-%y", "%d.%m.%y", "%d %b %y", "%d %B %y",
-    ]
-    for fmt in formats:
+    for fmt in _BILL_DATE_FORMATS:
         try:
             return dt.strptime(date_str.strip(), fmt).date()
         except (ValueError, TypeError):
@@ -106,8 +124,6 @@ def build_monthly_df(df):
     Returns a pandas DataFrame with one row per calendar month (sorted
     chronologically) or ``None`` when no bills have usable date ranges.
     """
-    import pandas as pd
-
     monthly_rows: list[dict] = []
     for _, row in df.iterrows():
         start = row.get('period_start')
@@ -176,3 +192,53 @@ def compute_billing_days(start_str: str | None, end_str: str | None) -> int | No
     if start and end:
         return (end - start).days
     return None
+
+
+def bill_label(row) -> str:
+    """Generate a short label for a bill in comparison charts."""
+    if row.get('period_start') is not None and pd.notna(row['period_start']):
+        return row['period_start'].strftime('%b %Y')
+    if row.get('bill_date') and row['bill_date']:
+        parsed = parse_bill_date(row['bill_date'])
+        if parsed:
+            return parsed.strftime('%b %Y')
+        return str(row['bill_date'])[:10]
+    return str(row['filename'])[:20]
+
+
+def dedup_labels(labels) -> list[str]:
+    """Suffix repeated chart labels with their occurrence number.
+
+    ``["Mar 2025", "Mar 2025", "Apr 2025"]`` becomes
+    ``["Mar 2025 (1)", "Mar 2025 (2)", "Apr 2025"]``; unique labels are
+    returned unchanged.
+    """
+    labels = list(labels)
+    counts = Counter(labels)
+    seen: Counter = Counter()
+    result = []
+    for label in labels:
+        if counts[label] > 1:
+            seen[label] += 1
+            result.append(f"{label} ({seen[label]})")
+        else:
+            result.append(label)
+    return result
+
+
+# (level, color, bg, label, suggestion) for the high/partial/low buckets.
+CONFIDENCE_LEVELS = (
+    ("high", "#22c55e", "rgba(34,197,94,0.1)",
+     "High confidence", None),
+    ("partial", "#f59e0b", "rgba(245,158,11,0.1)",
+     "Partial extraction",
+     "Review highlighted values against the original bill."),
+    ("low", "#ef4444", "rgba(239,68,68,0.1)",
+     "Low confidence",
+     "Consider uploading a clearer scan or the PDF version if available."),
+)
+
+
+def confidence_level(pct: int):
+    """Return (level, color, bg, label, suggestion) for a confidence percentage."""
+    return CONFIDENCE_LEVELS[0 if pct >= 80 else 1 if pct >= 60 else 2]
@@ -28,6 +28,15 @@ def is_hdf_file(file_content: bytes) -> bool:
         return False
 
 
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+
+def is_image_file(filename: str) -> bool:
+    """Check if a filename has one of the supported bill image extensions."""
+    # Only the tail can hold the extension, so avoid lowercasing long names.
+    return filename[-5:].lower().endswith(IMAGE_EXTENSIONS)
+
+
 def content_hash(data: bytes) -> str:
     """Return the MD5 hex digest of raw bytes (for cache keys)."""
     return hashlib.md5(data).hexdigest()
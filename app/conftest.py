@@ -13,12 +13,76 @@ Run E2E tests only:
 
 Run everything:
     pytest -m ""
+
+Run E2E tests in parallel (requires pytest-xdist):
+    pytest -m e2e -n auto --dist=loadgroup
+
+Parallelism is per process on purpose: the suite and its helpers use the sync
+Playwright API, and each worker gets its own Streamlit server and browser, so
+workers never share an event loop, server session or page.
+
+Shard E2E tests across CI jobs by recorded duration (requires pytest-split).
+No .test_durations file is committed yet, so record one first; without it
+pytest-split splits by test count. Each shard can still fan out with -n:
+    pytest -m e2e --store-durations
+    pytest -m e2e --splits 4 --group 1 -n auto --dist=loadgroup
+
+Iterating on a few E2E tests locally, keep the server up between runs and
+reuse it instead of paying for a fresh start each time:
+    pytest -m e2e --keep-streamlit          # first run leaves it running
+    pytest -m e2e --reuse-server -k badge   # later runs attach to it
 """
+import os
+import re
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
 import pytest
 
+APP_DIR = os.path.dirname(__file__)
+APP_PATH = os.path.join(APP_DIR, "main.py")
+STREAMLIT_PORT = 8610  # Default port for the shared test server
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("metermate", "Streamlit test server")
+    group.addoption(
+        "--reuse-server",
+        action="store_true",
+        help="Use a Streamlit server already running on the test port "
+             "instead of starting one (ignored under pytest-xdist).",
+    )
+    group.addoption(
+        "--keep-streamlit",
+        action="store_true",
+        help="Leave the test Streamlit server running after the session, "
+             "for a later --reuse-server run.",
+    )
+
+
+def _server_is_up(url: str, timeout: float) -> bool:
+    """Whether a Streamlit server answers its health check at ``url``."""
+    try:
+        with urllib.request.urlopen(f"{url}/_stcore/health", timeout=timeout):
+            return True
+    except Exception:
+        return False
 
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(config, items):
     """Auto-skip E2E tests unless the user explicitly selects them."""
+    # Under pytest-xdist --dist=loadgroup, keep each E2E class on one worker
+    # so class-scoped upload fixtures and the worker's Streamlit server are
+    # reused. Runs before xdist's own hook reads the groups.
+    if config.pluginmanager.hasplugin("xdist"):
+        for item in items:
+            if "e2e" in item.keywords and item.cls is not None:
+                item.add_marker(pytest.mark.xdist_group(name=item.cls.__qualname__))
+
     # If the user passed an explicit marker expression, respect it.
     marker_expr = config.getoption("-m", default="")
     if marker_expr:
@@ -30,3 +94,253 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         if "e2e" in item.keywords:
             item.add_marker(skip_e2e)
+
+
+# ---------------------------------------------------------------------------
+# Shared Streamlit server
+# ---------------------------------------------------------------------------
+# Every E2E module uses this one server, so a session (or xdist worker)
+# pays for a single Streamlit cold start.
+
+def _free_port() -> int:
+    """Ask the OS for an unused TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("", 0))
+        return sock.getsockname()[1]
+
+
+# Each page's script first runs when a browser session opens it, so both
+# pages are opened once during setup to keep that cost out of whichever test
+# happens to run first. Extraction results are cached server-wide
+# (st.cache_data), so uploading the native PDFs most tests use once also
+# makes their later uploads cache hits. Scans and photos are left out: OCR
+# on them would cost more at setup than it saves.
+_WARM_PAGES = ("Bill_Extractor", "Meter_Analysis")
+_WARM_BILLS = (
+    "1845.pdf",
+    "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf",
+    "2024 Mar - Apr.pdf",
+)
+BILLS_DIR = os.path.join(APP_DIR, "..", "sample_bills")
+_SCRIPT_IDLE = '[data-testid="stApp"][data-test-script-state="notRunning"]'
+_BILL_RENDERED = '[data-testid="confidence-badge"], .extraction-failed-card'
+_COMPARISON_READY = '[data-testid="comparison-ready"]'
+
+
+def _warm_pages(browser, url: str) -> None:
+    """Run each subpage's script once, and extract the common sample bills."""
+    bills = [
+        os.path.join(BILLS_DIR, name) for name in _WARM_BILLS
+        if os.path.exists(os.path.join(BILLS_DIR, name))
+    ]
+    ctx = browser.new_context()
+    try:
+        pg = ctx.new_page()
+        for name in _WARM_PAGES:
+            pg.goto(f"{url}/{name}", wait_until="domcontentloaded")
+            pg.locator(_SCRIPT_IDLE).wait_for(state="attached", timeout=60000)
+            if name == "Bill_Extractor" and bills:
+                file_input = pg.locator('[data-testid="stFileUploader"] input[type="file"]')
+                file_input.set_input_files(bills)
+                ready = _COMPARISON_READY if len(bills) > 1 else _BILL_RENDERED
+                pg.locator(ready).first.wait_for(state="attached", timeout=120000)
+    finally:
+        ctx.close()
+
+
+def _start_streamlit(port: int):
+    """Start Streamlit on ``port`` and wait for its health check.
+
+    Returns ``(proc, log)``. Server output goes to DEVNULL: an undrained
+    PIPE fills after ~64KB and blocks Streamlit mid-test. Set
+    ``STREAMLIT_TEST_LOG=1`` to write it to ``/tmp/streamlit_<port>.log``
+    instead.
+    """
+    url = f"http://localhost:{port}"
+    if _server_is_up(url, timeout=0.5):
+        # Most likely a server left behind by --keep-streamlit; a new one
+        # could not bind, and the health check below would pass against
+        # the old one.
+        pytest.fail(
+            f"A server is already running on port {port}; stop it or "
+            "pass --reuse-server to use it"
+        )
+    if os.environ.get("STREAMLIT_TEST_LOG"):
+        log = open(f"/tmp/streamlit_{port}.log", "w")
+    else:
+        log = subprocess.DEVNULL
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", APP_PATH,
+            "--server.port", str(port),
+            "--server.headless", "true",
+            "--browser.gatherUsageStats", "false",
+            # No file watcher: nothing is edited mid-run, and it would
+            # otherwise poll the source tree for the whole session
+            "--server.fileWatcherType", "none",
+            "--server.runOnSave", "false",
+        ],
+        cwd=APP_DIR,
+        # The server's imports needn't leave .pyc files behind
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+
+    # /_stcore/health answers as soon as the server is up, without rendering
+    # the app; poll it with a short, growing backoff rather than 1s sleeps.
+    deadline = time.monotonic() + 40
+    delay = 0.1
+    while not _server_is_up(url, timeout=2):
+        if proc.poll() is not None or time.monotonic() >= deadline:
+            proc.terminate()
+            pytest.fail("Streamlit app did not start within 40 seconds")
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+    if proc.poll() is not None:
+        pytest.fail(f"Streamlit exited with code {proc.returncode} on startup")
+    return proc, log
+
+
+def _stop_streamlit(proc, log) -> None:
+    if log is not subprocess.DEVNULL:
+        log.close()  # the server keeps its own handle
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait(timeout=5)
+
+
+@pytest.fixture(scope="session")
+def streamlit_app(pytestconfig, browser):
+    """Start the Streamlit app once per test session (per xdist worker).
+
+    Under pytest-xdist each worker starts its own server on a free port.
+
+    With ``--reuse-server`` a server already answering on the default port
+    is used as is; ``--keep-streamlit`` leaves the started server running
+    (both are ignored under xdist).
+    A freshly started server has its subpages and the common sample bills
+    warmed before the first test.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    port = _free_port() if worker else STREAMLIT_PORT
+    url = f"http://localhost:{port}"
+    if (not worker and pytestconfig.getoption("reuse_server")
+            and _server_is_up(url, timeout=0.5)):
+        yield url
+        return
+
+    proc, log = _start_streamlit(port)
+    try:
+        _warm_pages(browser, url)
+    except Exception:
+        proc.terminate()
+        raise
+
+    yield url
+
+    # Worker servers sit on throwaway ports nothing would reuse
+    if pytestconfig.getoption("keep_streamlit") and not worker:
+        if log is not subprocess.DEVNULL:
+            log.close()
+        return
+    _stop_streamlit(proc, log)
+
+
+@pytest.fixture(scope="module")
+def cold_streamlit_app():
+    """A server of the module's own, with nothing warmed or cached.
+
+    For modules that must exercise the real extraction pipeline rather than
+    hit results the shared server has already cached.
+    """
+    port = _free_port()
+    proc, log = _start_streamlit(port)
+    yield f"http://localhost:{port}"
+    _stop_streamlit(proc, log)
+
+
+# ---------------------------------------------------------------------------
+# Shared browser context
+# ---------------------------------------------------------------------------
+# pytest-playwright's default ``context`` is function-scoped, so every test
+# pays for a fresh browser context. Streamlit keeps its session state per
+# websocket (i.e. per page), so a new page inside a shared context still gets
+# a clean app session — only cookies need clearing between tests, and no
+# "Clear All Bills" teardown is needed.
+#
+# The context is opened on pytest-playwright's session ``browser``, so each
+# worker runs a single Chromium, the same one the server warm-up uses.
+
+# Assertions read text and the DOM only, so images, fonts and media are dead
+# weight on every navigation and rerun. Matching by URL (not a catch-all
+# route checking resource_type) keeps every other request off the Python
+# route handler.
+_BLOCKED_ASSETS = re.compile(
+    r"\.(png|jpe?g|gif|webp|ico|woff2?|ttf|otf|mp4|webm|mp3|wav)(\?.*)?$",
+    re.IGNORECASE,
+)
+
+
+def _block_assets(ctx) -> None:
+    ctx.route(_BLOCKED_ASSETS, lambda route: route.abort())
+
+
+# The app needs no GPU, extensions, audio or background networking, so
+# trimming them lowers each worker's CPU and memory and lets -n scale further.
+_CHROMIUM_ARGS = (
+    "--disable-dev-shm-usage",  # /dev/shm is tiny in containers
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-renderer-backgrounding",
+    "--mute-audio",
+)
+
+
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args):
+    """Launch Chromium with lean flags, and always headless under xdist.
+
+    ``--headed`` still works in a single process for debugging; parallel
+    workers each opening a visible window would only burn CPU.
+    """
+    args = list(browser_type_launch_args.get("args", []))
+    args.extend(a for a in _CHROMIUM_ARGS if a not in args)
+    launch_args = {**browser_type_launch_args, "args": args}
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        launch_args["headless"] = True
+    return launch_args
+
+
+@pytest.fixture(scope="session")
+def context(browser, browser_context_args):
+    """One browser context per session (per xdist worker)."""
+    ctx = browser.new_context(**browser_context_args)
+    _block_assets(ctx)
+    yield ctx
+    ctx.close()
+
+
+@pytest.fixture
+def page(context):
+    """A fresh page (and so a fresh Streamlit session) in the shared context."""
+    pg = context.new_page()
+    yield pg
+    pg.goto("about:blank")
+    pg.close()
+    context.clear_cookies()
+
+
+@pytest.fixture
+def fresh_page(browser, browser_context_args):
+    """A page in its own throwaway context, for tests that need full isolation."""
+    ctx = browser.new_context(**browser_context_args)
+    _block_assets(ctx)
+    pg = ctx.new_page()
+    yield pg
+    ctx.close()
@@ -8,10 +8,8 @@ compare. No mode switching required.
 import os
 import streamlit as st
 import pandas as pd
-import io
 from pathlib import Path
 from datetime import datetime, timedelta
-from dataclasses import asdict
 
 # Bridge Streamlit Cloud secrets into env vars for pipeline code
 for _key in ("GEMINI_API_KEY", "GOOGLE_GENAI_USE_VERTEXAI"):
@@ -41,9 +39,20 @@ from common.formatters import (
     parse_bill_date as parse_bill_date_util,
     compute_billing_days,
     build_monthly_df,
+    bill_label,
+    dedup_labels,
+    format_currency,
+    format_kwh,
+    format_rate,
+    confidence_level,
+)
+from common.excel_export import (
+    count_extracted_fields,
+    generate_bill_excel,
+    generate_comparison_excel,
 )
 from common.comparison import NO_MPRN_LABEL, filter_dataframe_by_mprn
-from common.session import content_hash
+from common.session import content_hash, is_image_file
 import plotly.graph_objects as go
 import streamlit.components.v1 as components
 
@@ -106,35 +115,63 @@ def _load_logo():
     return None
 
 
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+def _run_extraction(file_hash: str, _file_content: bytes, is_image: bool) -> dict:
+    """Run the extraction pipeline, memoised on the file's content hash.
+
+    The bytes argument is underscore-prefixed so Streamlit keys the cache on
+    ``file_hash`` instead of re-hashing the whole file. Re-uploading a file
+    (or uploading it in another session) returns the cached result.
+    """
+    if is_image:
+        pipeline_result = extract_bill_from_image(_file_content)
+    else:
+        pipeline_result = extract_bill_pipeline(_file_content)
+
+    meta = {
+        "path": " -> ".join(pipeline_result.extraction_path),
+        "provider": pipeline_result.provider_detection.provider_name,
+        "score": pipeline_result.confidence.score,
+        "band": pipeline_result.confidence.band,
+        "tier4_fields": (
+            len(pipeline_result.tier4.fields)
+            if pipeline_result.tier4 is not None else None
+        ),
+    }
+
+    return {
+        "bill": generic_to_legacy(pipeline_result.bill),
+        "raw_text": pipeline_result.bill.raw_text,
+        **meta,
+    }
+
+
 def _extract_bill(file_content: bytes, filename: str) -> dict:
     """Extract a bill from file content, returning a result dict."""
     file_hash = content_hash(file_content)
 
     try:
-        is_image = filename.lower().endswith(('.jpg', '.jpeg', '.png'))
+        is_image = is_image_file(filename)
         print(f"[EXTRACT] Starting extraction: {filename} ({'image' if is_image else 'pdf'}, {len(file_content):,} bytes)")
 
-        if is_image:
-            pipeline_result = extract_bill_from_image(file_content)
-        else:
-            pipeline_result = extract_bill_pipeline(file_content)
+        extraction = _run_extraction(file_hash, file_content, is_image)
 
-        path = " -> ".join(pipeline_result.extraction_path)
-        provider = pipeline_result.provider_detection.provider_name
-        conf = pipeline_result.confidence
-        tier4_fired = pipeline_result.tier4 is not None
-        tier4_fields = len(pipeline_result.tier4.fields) if tier4_fired else 0
+        path = extraction["path"]
+        provider = extraction["provider"]
+        score, band = extraction["score"], extraction["band"]
+        tier4_fired = extraction["tier4_fields"] is not None
+        tier4_fields = extraction["tier4_fields"] or 0
 
         print(f"[EXTRACT] Provider: {provider}")
         print(f"[EXTRACT] Path: {path}")
-        print(f"[EXTRACT] Confidence: {conf.score:.2f} ({conf.band})")
+        print(f"[EXTRACT] Confidence: {score:.2f} ({band})")
         if tier4_fired:
             print(f"[EXTRACT] Tier 4 LLM fired: YES ({tier4_fields} fields extracted)")
         else:
-            print(f"[EXTRACT] Tier 4 LLM fired: NO (confidence was '{conf.band}', not 'escalate')")
+            print(f"[EXTRACT] Tier 4 LLM fired: NO (confidence was '{band}', not 'escalate')")
 
-        bill = generic_to_legacy(pipeline_result.bill)
-        field_count = _count_extracted_fields(bill)
+        bill = extraction["bill"]
+        field_count = count_extracted_fields(bill)
 
         print(f"[EXTRACT] Result: {field_count} fields extracted for {filename}")
 
@@ -142,19 +179,19 @@ def _extract_bill(file_content: bytes, filename: str) -> dict:
         llm_msg = (
             f"[EXTRACT] Tier 4 LLM: YES ({tier4_fields} fields)"
             if tier4_fired
-            else f"[EXTRACT] Tier 4 LLM: NO (confidence='{conf.band}')"
+            else f"[EXTRACT] Tier 4 LLM: NO (confidence='{band}')"
         )
         _browser_log(
             f"[EXTRACT] {filename} | {provider} | {field_count} fields",
             f"[EXTRACT] Path: {path}",
-            f"[EXTRACT] Confidence: {conf.score:.2f} ({conf.band})",
+            f"[EXTRACT] Confidence: {score:.2f} ({band})",
             llm_msg,
         )
 
         return {
             "filename": filename,
             "bill": bill,
-            "raw_text": pipeline_result.bill.raw_text,
+            "raw_text": extraction["raw_text"],
             "confidence": bill.confidence_score,
             "content_hash": file_hash,
             "status": "success",
@@ -178,31 +215,6 @@ def _extract_bill(file_content: bytes, filename: str) -> dict:
         }
 
 
-def _count_extracted_fields(bill: BillData) -> int:
-    """Count the number of non-None extracted fields."""
-    bill_dict = asdict(bill)
-    skip = {'extraction_method', 'confidence_score', 'warnings'}
-    return sum(
-        1 for k, v in bill_dict.items()
-        if k not in skip and v is not None
-    )
-
-
-def _confidence_level(pct: int):
-    """Return (level, color, bg, label, suggestion) for a confidence percentage."""
-    if pct >= 80:
-        return ("high", "#22c55e", "rgba(34,197,94,0.1)",
-                "High confidence", None)
-    elif pct >= 60:
-        return ("partial", "#f59e0b", "rgba(245,158,11,0.1)",
-                "Partial extraction",
-                "Review highlighted values against the original bill.")
-    else:
-        return ("low", "#ef4444", "rgba(239,68,68,0.1)",
-                "Low confidence",
-                "Consider uploading a clearer scan or the PDF version if available.")
-
-
 def _get_edit(key_suffix: str, field_name: str):
     """Retrieve an edited value from session state, or None if not edited."""
     return st.session_state.bill_edits.get(f"{key_suffix}_{field_name}")
@@ -228,6 +240,38 @@ def _edited_or_original(bill, field_name: str, key_suffix: str):
     return getattr(bill, field_name, None)
 
 
+def _apply_bill_edits(bill: BillData, key_suffix: str) -> None:
+    """Save Changes callback: store changed edit-form values in ``bill_edits``.
+
+    Runs before the rerun the submit triggers, so that single rerun already
+    renders the edits — no second ``st.rerun()`` is needed.
+    """
+    _edit_fields = {
+        "supplier": ("ef_supplier", bill.supplier),
+        "mprn": ("ef_mprn", bill.mprn),
+        "bill_date": ("ef_bill_date", bill.bill_date),
+        "billing_period_start": ("ef_period_start", bill.billing_period_start),
+        "billing_period_end": ("ef_period_end", bill.billing_period_end),
+        "day_rate": ("ef_day_rate", bill.day_rate),
+        "night_rate": ("ef_night_rate", bill.night_rate),
+        "standing_charge_total": ("ef_standing", bill.standing_charge_total),
+        "total_this_period": ("ef_total_cost", bill.total_this_period),
+        "amount_due": ("ef_amount_due", bill.amount_due),
+    }
+    for field_name, (widget_key, orig_val) in _edit_fields.items():
+        edit_key = f"{key_suffix}_{field_name}"
+        new_str = str(st.session_state.get(f"{widget_key}{key_suffix}", "")).strip()
+        orig_str = str(orig_val or "").strip()
+        if new_str and new_str != orig_str:
+            # Try numeric conversion for cost/rate fields
+            try:
+                st.session_state.bill_edits[edit_key] = float(new_str)
+            except ValueError:
+                st.session_state.bill_edits[edit_key] = new_str
+        elif not new_str and edit_key in st.session_state.bill_edits:
+            del st.session_state.bill_edits[edit_key]
+
+
 def show_bill_summary(bill: BillData, raw_text: str | None = None,
                       key_suffix: str = ""):
     """Display extracted bill data as a clean single-page summary.
@@ -255,12 +299,11 @@ def show_bill_summary(bill: BillData, raw_text: str | None = None,
                   "total_this_period"],
         "Balance": ["previous_balance", "payments_received", "amount_due"],
     }
-    bill_dict = asdict(bill)
     section_parts = []
     total_extracted = 0
     total_expected = 0
     for section_name, fields in _sections.items():
-        count = sum(1 for f in fields if bill_dict.get(f) is not None)
+        count = sum(1 for f in fields if getattr(bill, f) is not None)
         section_parts.append(f"{section_name}: {count}/{len(fields)}")
         total_extracted += count
         total_expected += len(fields)
@@ -275,7 +318,7 @@ def show_bill_summary(bill: BillData, raw_text: str | None = None,
             if field_match:
                 warn_fields.add(field_match)
 
-    level, color, bg, level_label, suggestion = _confidence_level(confidence_pct)
+    level, color, bg, level_label, suggestion = confidence_level(confidence_pct)
 
     badge_html = (
         f'<div data-testid="confidence-badge" data-level="{level}" '
@@ -437,9 +480,7 @@ def show_bill_summary(bill: BillData, raw_text: str | None = None,
             ]
             for i, (label, fname) in enumerate(rate_fields):
                 with cols[i]:
-                    def _fmt_rate(v):
-                        return f"\u20ac{v:.4f}/kWh" if v is not None else None
-                    display, is_edited, orig = _display_value(bill, fname, key_suffix, format_fn=_fmt_rate)
+                    display, is_edited, orig = _display_value(bill, fname, key_suffix, format_fn=format_rate)
                     st.markdown(
                         field_html(label, display, edited=is_edited, original=orig),
                         unsafe_allow_html=True,
@@ -456,9 +497,7 @@ def show_bill_summary(bill: BillData, raw_text: str | None = None,
     ]
     for i, (label, fname) in enumerate(cost_field_names):
         with cols[i]:
-            def _fmt_eur(v):
-                return f"\u20ac{v:,.2f}" if v is not None else None
-            display, is_edited, orig = _display_value(bill, fname, key_suffix, format_fn=_fmt_eur)
+            display, is_edited, orig = _display_value(bill, fname, key_suffix, format_fn=format_currency)
             st.markdown(
                 field_html(label, display, edited=is_edited, original=orig),
                 unsafe_allow_html=True,
@@ -470,16 +509,16 @@ def show_bill_summary(bill: BillData, raw_text: str | None = None,
         detail = ""
         if bill.standing_charge_days and bill.standing_charge_rate:
             detail = f" ({bill.standing_charge_days} days at \u20ac{bill.standing_charge_rate:.4f}/day)"
-        line_items.append(("Standing Charge", f"\u20ac{bill.standing_charge_total:,.2f}{detail}"))
+        line_items.append(("Standing Charge", f"{format_currency(bill.standing_charge_total)}{detail}"))
     if bill.pso_levy is not None:
-        line_items.append(("PSO Levy", f"\u20ac{bill.pso_levy:,.2f}"))
+        line_items.append(("PSO Levy", format_currency(bill.pso_levy)))
     if bill.discount is not None:
-        line_items.append(("Discount", f"\u20ac{bill.discount:,.2f} CR"))
+        line_items.append(("Discount", f"{format_currency(bill.discount)} CR"))
     if bill.vat_amount is not None:
         vat_detail = f" ({bill.vat_rate_pct:.0f}%)" if bill.vat_rate_pct else ""
-        line_items.append(("VAT", f"\u20ac{bill.vat_amount:,.2f}{vat_detail}"))
+        line_items.append(("VAT", f"{format_currency(bill.vat_amount)}{vat_detail}"))
     if bill.total_this_period is not None:
-        line_items.append(("Total This Period", f"\u20ac{bill.total_this_period:,.2f}"))
+        line_items.append(("Total This Period", format_currency(bill.total_this_period)))
 
     if line_items:
         for label, value in line_items:
@@ -501,12 +540,12 @@ def show_bill_summary(bill: BillData, raw_text: str | None = None,
         st.caption("Solar Export")
         detail = ""
         if bill.export_units and bill.export_rate:
-            detail = f" ({bill.export_units:,.1f} kWh at \u20ac{bill.export_rate:.4f}/kWh)"
+            detail = f" ({format_kwh(bill.export_units)} at {format_rate(bill.export_rate)})"
         if bill.export_credit is not None:
             st.markdown(
                 f'<div style="border-left: 3px solid #22c55e; padding-left: 0.5rem;">'
                 f'<span style="color: #22c55e; font-family: \'JetBrains Mono\', monospace;">'
-                f'\u20ac{bill.export_credit:,.2f} credit{detail}</span></div>',
+                f'{format_currency(bill.export_credit)} credit{detail}</span></div>',
                 unsafe_allow_html=True,
             )
 
@@ -518,10 +557,10 @@ def show_bill_summary(bill: BillData, raw_text: str | None = None,
         st.subheader("\U0001f3e6 Balance")
         cols = st.columns(3)
         with cols[0]:
-            display = f"\u20ac{bill.previous_balance:,.2f}" if bill.previous_balance is not None else None
+            display = format_currency(bill.previous_balance) if bill.previous_balance is not None else None
             st.markdown(field_html("Previous Balance", display), unsafe_allow_html=True)
         with cols[1]:
-            display = f"\u20ac{bill.payments_received:,.2f}" if bill.payments_received is not None else None
+            display = format_currency(bill.payments_received) if bill.payments_received is not None else None
             st.markdown(field_html("Payments Received", display), unsafe_allow_html=True)
         with cols[2]:
             if bill.amount_due is not None:
@@ -529,7 +568,7 @@ def show_bill_summary(bill: BillData, raw_text: str | None = None,
                     f'<div style="border-left: 3px solid #4ade80; padding-left: 0.5rem;">'
                     f'<span style="color: #94a3b8; font-size: 0.8rem;">Amount Due</span><br>'
                     f'<span style="color: #4ade80; font-family: \'JetBrains Mono\', monospace; '
-                    f'font-size: 1.3rem; font-weight: 700;">\u20ac{bill.amount_due:,.2f}</span></div>',
+                    f'font-size: 1.3rem; font-weight: 700;">{format_currency(bill.amount_due)}</span></div>',
                     unsafe_allow_html=True,
                 )
             else:
@@ -537,104 +576,84 @@ def show_bill_summary(bill: BillData, raw_text: str | None = None,
 
     # --- Inline Editing ---
     st.divider()
-    with st.expander("\u270f\ufe0f Edit Extracted Values", expanded=False):
-        st.caption(
-            "Correct any misidentified values. Edits are marked blue and "
-            "included in exports."
-        )
-        with st.form(key=f"edit_form{key_suffix}"):
-            col1, col2 = st.columns(2)
-            _edits = st.session_state.bill_edits
-
-            with col1:
-                st.markdown("**Identity & Dates**")
-                ef_supplier = st.text_input(
-                    "Supplier",
-                    value=_edits.get(f"{key_suffix}_supplier", bill.supplier or ""),
-                    key=f"ef_supplier{key_suffix}",
-                )
-                ef_mprn = st.text_input(
-                    "MPRN",
-                    value=_edits.get(f"{key_suffix}_mprn", bill.mprn or ""),
-                    key=f"ef_mprn{key_suffix}",
-                )
-                ef_bill_date = st.text_input(
-                    "Bill Date",
-                    value=_edits.get(f"{key_suffix}_bill_date", bill.bill_date or ""),
-                    key=f"ef_bill_date{key_suffix}",
-                )
-                ef_period_start = st.text_input(
-                    "Period Start",
-                    value=_edits.get(f"{key_suffix}_billing_period_start",
-                                     bill.billing_period_start or ""),
-                    key=f"ef_period_start{key_suffix}",
-                )
-                ef_period_end = st.text_input(
-                    "Period End",
-                    value=_edits.get(f"{key_suffix}_billing_period_end",
-                                     bill.billing_period_end or ""),
-                    key=f"ef_period_end{key_suffix}",
-                )
+    # Keyed container gives the expander a stable st-key-* class for tests
+    with st.container(key=f"edit_expander{key_suffix}"):
+        with st.expander("\u270f\ufe0f Edit Extracted Values", expanded=False):
+            st.caption(
+                "Correct any misidentified values. Edits are marked blue and "
+                "included in exports."
+            )
+            with st.form(key=f"edit_form{key_suffix}"):
+                col1, col2 = st.columns(2)
+                _edits = st.session_state.bill_edits
 
-            with col2:
-                st.markdown("**Consumption & Costs**")
-                ef_day_rate = st.text_input(
-                    "Day Rate (\u20ac/kWh)",
-                    value=str(_edits.get(f"{key_suffix}_day_rate",
-                                          bill.day_rate or "")),
-                    key=f"ef_day_rate{key_suffix}",
-                )
-                ef_night_rate = st.text_input(
-                    "Night Rate (\u20ac/kWh)",
-                    value=str(_edits.get(f"{key_suffix}_night_rate",
-                                          bill.night_rate or "")),
-                    key=f"ef_night_rate{key_suffix}",
-                )
-                ef_standing = st.text_input(
-                    "Standing Charge (\u20ac)",
-                    value=str(_edits.get(f"{key_suffix}_standing_charge_total",
-                                          bill.standing_charge_total or "")),
-                    key=f"ef_standing{key_suffix}",
-                )
-                ef_total_cost = st.text_input(
-                    "Total Cost (\u20ac)",
-                    value=str(_edits.get(f"{key_suffix}_total_this_period",
-                                          bill.total_this_period or "")),
-                    key=f"ef_total_cost{key_suffix}",
-                )
-                ef_amount_due = st.text_input(
-                    "Amount Due (\u20ac)",
-                    value=str(_edits.get(f"{key_suffix}_amount_due",
-                                          bill.amount_due or "")),
-                    key=f"ef_amount_due{key_suffix}",
-                )
+                with col1:
+                    st.markdown("**Identity & Dates**")
+                    st.text_input(
+                        "Supplier",
+                        value=_edits.get(f"{key_suffix}_supplier", bill.supplier or ""),
+                        key=f"ef_supplier{key_suffix}",
+                    )
+                    st.text_input(
+                        "MPRN",
+                        value=_edits.get(f"{key_suffix}_mprn", bill.mprn or ""),
+                        key=f"ef_mprn{key_suffix}",
+                    )
+                    st.text_input(
+                        "Bill Date",
+                        value=_edits.get(f"{key_suffix}_bill_date", bill.bill_date or ""),
+                        key=f"ef_bill_date{key_suffix}",
+                    )
+                    st.text_input(
+                        "Period Start",
+                        value=_edits.get(f"{key_suffix}_billing_period_start",
+                                         bill.billing_period_start or ""),
+                        key=f"ef_period_start{key_suffix}",
+                    )
+                    st.text_input(
+                        "Period End",
+                        value=_edits.get(f"{key_suffix}_billing_period_end",
+                                         bill.billing_period_end or ""),
+                        key=f"ef_period_end{key_suffix}",
+                    )
 
-            submitted = st.form_submit_button("Save Changes", type="primary")
-            if submitted:
-                _edit_map = {
-                    f"{key_suffix}_supplier": (ef_supplier, bill.supplier),
-                    f"{key_suffix}_mprn": (ef_mprn, bill.mprn),
-                    f"{key_suffix}_bill_date": (ef_bill_date, bill.bill_date),
-                    f"{key_suffix}_billing_period_start": (ef_period_start, bill.billing_period_start),
-                    f"{key_suffix}_billing_period_end": (ef_period_end, bill.billing_period_end),
-                    f"{key_suffix}_day_rate": (ef_day_rate, bill.day_rate),
-                    f"{key_suffix}_night_rate": (ef_night_rate, bill.night_rate),
-                    f"{key_suffix}_standing_charge_total": (ef_standing, bill.standing_charge_total),
-                    f"{key_suffix}_total_this_period": (ef_total_cost, bill.total_this_period),
-                    f"{key_suffix}_amount_due": (ef_amount_due, bill.amount_due),
-                }
-                for edit_key, (new_val, orig_val) in _edit_map.items():
-                    new_str = str(new_val).strip()
-                    orig_str = str(orig_val or "").strip()
-                    if new_str and new_str != orig_str:
-                        # Try numeric conversion for cost/rate fields
-                        try:
-                            st.session_state.bill_edits[edit_key] = float(new_str)
-                        except ValueError:
-                            st.session_state.bill_edits[edit_key] = new_str
-                    elif not new_str and edit_key in st.session_state.bill_edits:
-                        del st.session_state.bill_edits[edit_key]
-                st.rerun()
+                with col2:
+                    st.markdown("**Consumption & Costs**")
+                    st.text_input(
+                        "Day Rate (\u20ac/kWh)",
+                        value=str(_edits.get(f"{key_suffix}_day_rate",
+                                              bill.day_rate or "")),
+                        key=f"ef_day_rate{key_suffix}",
+                    )
+                    st.text_input(
+                        "Night Rate (\u20ac/kWh)",
+                        value=str(_edits.get(f"{key_suffix}_night_rate",
+                                              bill.night_rate or "")),
+                        key=f"ef_night_rate{key_suffix}",
+                    )
+                    st.text_input(
+                        "Standing Charge (\u20ac)",
+                        value=str(_edits.get(f"{key_suffix}_standing_charge_total",
+                                              bill.standing_charge_total or "")),
+                        key=f"ef_standing{key_suffix}",
+                    )
+                    st.text_input(
+                        "Total Cost (\u20ac)",
+                        value=str(_edits.get(f"{key_suffix}_total_this_period",
+                                              bill.total_this_period or "")),
+                        key=f"ef_total_cost{key_suffix}",
+                    )
+                    st.text_input(
+                        "Amount Due (\u20ac)",
+                        value=str(_edits.get(f"{key_suffix}_amount_due",
+                                              bill.amount_due or "")),
+                        key=f"ef_amount_due{key_suffix}",
+                    )
+
+                st.form_submit_button(
+                    "Save Changes", type="primary", key=f"save_changes{key_suffix}",
+                    on_click=_apply_bill_edits, args=(bill, key_suffix),
+                )
 
     # --- Export ---
     st.divider()
@@ -699,102 +718,10 @@ def _show_manual_entry_summary(bill: BillData):
     st.markdown('</div>', unsafe_allow_html=True)
 
 
-def generate_bill_excel(bill: BillData) -> io.BytesIO:
-    """Generate an Excel file from extracted bill data."""
-    buffer = io.BytesIO()
-    data = asdict(bill)
-    skip_meta = {'extraction_method', 'confidence_score', 'warnings'}
-
-    with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
-        # Sheet 1: Bill Summary
-        field_labels = {
-            'supplier': 'Supplier',
-            'customer_name': 'Customer Name',
-            'premises': 'Premises',
-            'mprn': 'MPRN',
-            'account_number': 'Account Number',
-            'invoice_number': 'Invoice Number',
-            'meter_number': 'Meter Number',
-            'dg_code': 'DG Code',
-            'mcc_code': 'MCC Code',
-            'bill_date': 'Bill Date',
-            'billing_period_start': 'Billing Period Start',
-            'billing_period_end': 'Billing Period End',
-            'payment_due_date': 'Payment Due Date',
-            'contract_end_date': 'Contract End Date',
-            'ceg_export_start': 'CEG Export Start',
-            'ceg_export_end': 'CEG Export End',
-            'day_units_kwh': 'Day Units (kWh)',
-            'night_units_kwh': 'Night Units (kWh)',
-            'peak_units_kwh': 'Peak Units (kWh)',
-            'total_units_kwh': 'Total Units (kWh)',
-            'day_rate': 'Day Rate (EUR/kWh)',
-            'night_rate': 'Night Rate (EUR/kWh)',
-            'peak_rate': 'Peak Rate (EUR/kWh)',
-            'day_cost': 'Day Cost (EUR)',
-            'night_cost': 'Night Cost (EUR)',
-            'peak_cost': 'Peak Cost (EUR)',
-            'standing_charge_days': 'Standing Charge Days',
-            'standing_charge_rate': 'Standing Charge Rate (EUR/day)',
-            'standing_charge_total': 'Standing Charge Total (EUR)',
-            'discount': 'Discount (EUR)',
-            'pso_levy': 'PSO Levy (EUR)',
-            'subtotal_before_vat': 'Subtotal Before VAT (EUR)',
-            'vat_rate_pct': 'VAT Rate (%)',
-            'vat_amount': 'VAT Amount (EUR)',
-            'total_this_period': 'Total This Period (EUR)',
-            'export_units': 'Export Units (kWh)',
-            'export_rate': 'Export Rate (EUR/kWh)',
-            'export_credit': 'Export Credit (EUR)',
-            'previous_balance': 'Previous Balance (EUR)',
-            'payments_received': 'Payments Received (EUR)',
-            'amount_due': 'Amount Due (EUR)',
-            'tariff_type': 'Tariff Type',
-            'eab_current': 'Current EAB (EUR)',
-            'eab_new': 'New EAB (EUR)',
-        }
-        rows = []
-        for key, value in data.items():
-            if key in skip_meta:
-                continue
-            label = field_labels.get(key, key.replace('_', ' ').title())
-            rows.append((label, value))
-
-        pd.DataFrame(rows, columns=['Field', 'Value']).to_excel(
-            writer, sheet_name='Bill Summary', index=False
-        )
-
-        # Sheet 2: Extraction Metadata
-        metadata = [
-            ('Extraction Method', bill.extraction_method),
-            ('Confidence Score', f"{bill.confidence_score:.1%}"),
-            ('Warnings', '; '.join(bill.warnings) if bill.warnings else 'None'),
-            ('Supplier Detected', bill.supplier or 'Unknown'),
-        ]
-        pd.DataFrame(metadata, columns=['Field', 'Value']).to_excel(
-            writer, sheet_name='Extraction Metadata', index=False
-        )
-
-    buffer.seek(0)
-    return buffer
-
-
 # ---------------------------------------------------------------------------
 # Multi-bill comparison
 # ---------------------------------------------------------------------------
 
-def _bill_label(row) -> str:
-    """Generate a short label for a bill in comparison charts."""
-    if row.get('period_start') is not None and pd.notna(row['period_start']):
-        return row['period_start'].strftime('%b %Y')
-    if row.get('bill_date') and row['bill_date']:
-        parsed = _parse_bill_date(row['bill_date'])
-        if parsed:
-            return parsed.strftime('%b %Y')
-        return str(row['bill_date'])[:10]
-    return str(row['filename'])[:20]
-
-
 def show_bill_comparison(bills, edit_indices=None):
     """Display multi-bill comparison view with tabs.
 
@@ -971,21 +898,10 @@ def show_bill_comparison(bills, edit_indices=None):
                 return
 
     # Generate chart labels
-    df['label'] = df.apply(_bill_label, axis=1)
+    df['label'] = df.apply(bill_label, axis=1)
 
     # Deduplicate labels by appending index when needed
-    label_counts = df['label'].value_counts()
-    if (label_counts > 1).any():
-        seen = {}
-        new_labels = []
-        for label in df['label']:
-            if label_counts[label] > 1:
-                idx = seen.get(label, 0) + 1
-                seen[label] = idx
-                new_labels.append(f"{label} ({idx})")
-            else:
-                new_labels.append(label)
-        df['label'] = new_labels
+    df['label'] = dedup_labels(df['label'])
 
     # Tabs
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -1007,6 +923,9 @@ def show_bill_comparison(bills, edit_indices=None):
     with tab5:
         _comparison_export(df, bills)
 
+    # Rendered last so E2E tests can wait for the whole view, not a guess
+    st.markdown('<div data-testid="comparison-ready"></div>', unsafe_allow_html=True)
+
 
 def _comparison_summary(df: pd.DataFrame):
     """Show summary table and key aggregate metrics."""
@@ -1099,7 +1018,7 @@ def _comparison_summary(df: pd.DataFrame):
     # Add traffic-light confidence level to DataFrame
     def _conf_label(score):
         pct = round(score * 100)
-        level, color, _, label, _ = _confidence_level(pct)
+        level, color, _, label, _ = confidence_level(pct)
         return f"{label} ({pct}%)"
 
     df_display = df.copy()
@@ -1634,7 +1553,7 @@ def _comparison_export(df: pd.DataFrame, bills):
     st.markdown("### Export Comparison Data")
 
     if st.button("Generate Comparison Excel", type="primary", key="comparison_export_btn"):
-        buffer = _generate_comparison_excel(df, bills)
+        buffer = generate_comparison_excel(df, bills)
         st.download_button(
             label="Download Excel File",
             data=buffer.getvalue(),
@@ -1644,84 +1563,6 @@ def _comparison_export(df: pd.DataFrame, bills):
         )
 
 
-def _generate_comparison_excel(df: pd.DataFrame, bills) -> io.BytesIO:
-    """Generate Excel comparison workbook with computed columns and totals."""
-    buffer = io.BytesIO()
-
-    with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
-        # Summary sheet — includes computed columns
-        summary_cols = [
-            'filename', 'supplier', 'mprn', 'bill_date', 'billing_period',
-            'billing_days', 'total_kwh', 'day_kwh', 'night_kwh', 'peak_kwh',
-            'day_rate', 'night_rate', 'peak_rate',
-            'standing_charge', 'standing_charge_rate',
-            'subtotal', 'vat', 'total_cost', 'amount_due',
-            'cost_per_day', 'kwh_per_day', 'effective_rate', 'annualised_cost',
-        ]
-        summary_labels = {
-            'filename': 'File', 'supplier': 'Supplier', 'mprn': 'MPRN',
-            'bill_date': 'Bill Date', 'billing_period': 'Billing Period',
-            'billing_days': 'Billing Days',
-            'total_kwh': 'Total kWh', 'day_kwh': 'Day kWh',
-            'night_kwh': 'Night kWh', 'peak_kwh': 'Peak kWh',
-            'day_rate': 'Day Rate (\u20ac/kWh)', 'night_rate': 'Night Rate (\u20ac/kWh)',
-            'peak_rate': 'Peak Rate (\u20ac/kWh)',
-            'standing_charge': 'Standing Charge (\u20ac)',
-            'standing_charge_rate': 'Standing \u20ac/day',
-            'subtotal': 'Subtotal (\u20ac)',
-            'vat': 'VAT (\u20ac)', 'total_cost': 'Total Cost (\u20ac)',
-            'amount_due': 'Amount Due (\u20ac)',
-            'cost_per_day': 'Cost/Day (\u20ac)',
-            'kwh_per_day': 'kWh/Day',
-            'effective_rate': 'Effective \u20ac/kWh',
-            'annualised_cost': 'Annualised Cost (\u20ac)',
-        }
-
-        available = [c for c in summary_cols if c in df.columns]
-        export_df = df[available].copy()
-
-        # Build totals/averages row
-        totals = {}
-        for col in available:
-            if col in ('filename',):
-                totals[col] = 'TOTAL / AVG'
-            elif col in ('supplier', 'mprn', 'bill_date', 'billing_period'):
-                totals[col] = ''
-            elif col in ('total_kwh', 'day_kwh', 'night_kwh', 'peak_kwh',
-                         'standing_charge', 'subtotal', 'vat', 'total_cost',
-                         'amount_due', 'billing_days'):
-                totals[col] = df[col].sum() if df[col].notna().any() else None
-            elif col in ('day_rate', 'night_rate', 'peak_rate',
-                         'standing_charge_rate', 'cost_per_day', 'kwh_per_day',
-                         'effective_rate', 'annualised_cost'):
-                totals[col] = df[col].mean() if df[col].notna().any() else None
-
-        totals_row = pd.DataFrame([totals])
-        export_df = pd.concat([export_df, totals_row], ignore_index=True)
-
-        export_df = export_df.rename(
-            columns={k: v for k, v in summary_labels.items() if k in available}
-        )
-        export_df.to_excel(writer, sheet_name='Comparison', index=False)
-
-        # Individual bill sheets
-        for bill, filename in bills:
-            bill_dict = asdict(bill)
-            bill_rows = [
-                (k.replace('_', ' ').title(), v)
-                for k, v in bill_dict.items()
-                if k not in {'extraction_method', 'confidence_score', 'warnings'}
-            ]
-            # Excel sheet name max 31 chars
-            sheet_name = filename[:31].replace('/', '-').replace('\\', '-')
-            pd.DataFrame(bill_rows, columns=['Field', 'Value']).to_excel(
-                writer, sheet_name=sheet_name, index=False,
-            )
-
-    buffer.seek(0)
-    return buffer
-
-
 # =========================================================================
 # Sidebar
 # =========================================================================
@@ -1753,6 +1594,8 @@ with st.sidebar:
         if st.button("Clear All Bills", use_container_width=True, key="clear_bills"):
             st.session_state.extracted_bills = []
             st.session_state.processed_hashes = set()
+            # _run_extraction's cache is left warm on purpose: re-uploading
+            # a cleared bill should not pay for extraction again.
             # Increment uploader key to force widget reset (clears stale filenames)
             st.session_state["uploader_key"] = st.session_state.get("uploader_key", 0) + 1
             st.rerun()
@@ -1952,7 +1795,8 @@ if bills:
                 color = "#ef4444"
                 icon = "\u26a0"
             chip_html += (
-                f'<div style="display: inline-flex; align-items: center; gap: 0.4rem; '
+                f'<div data-testid="status-chip" '
+                f'style="display: inline-flex; align-items: center; gap: 0.4rem; '
                 f'padding: 0.3rem 0.8rem; background: #1e2433; border: 1px solid {color}; '
                 f'border-radius: 16px; font-size: 0.85rem;">'
                 f'<span style="color: {color};">{icon}</span>'
@@ -1962,7 +1806,8 @@ if bills:
             )
         else:
             chip_html += (
-                f'<div style="display: inline-flex; align-items: center; gap: 0.4rem; '
+                f'<div data-testid="status-chip" '
+                f'style="display: inline-flex; align-items: center; gap: 0.4rem; '
                 f'padding: 0.3rem 0.8rem; background: #1e2433; border: 1px solid #ef4444; '
                 f'border-radius: 16px; font-size: 0.85rem;">'
                 f'<span style="color: #ef4444;">\u2717</span>'
@@ -1986,7 +1831,7 @@ error_bills = [b for b in bills if b["status"] == "error"]
 # Show errors with actionable guidance
 for entry in error_bills:
     fname = entry["filename"]
-    is_image = fname.lower().endswith(('.jpg', '.jpeg', '.png'))
+    is_image = is_image_file(fname)
     if is_image:
         suggestions = (
             '<ol class="suggestion-list">'
@@ -47,7 +47,9 @@ from bill_verification import (
 from common.theme import apply_theme
 from common.components import render_anomaly_cards
 from common.session import (
+    content_hash,
     is_hdf_file,
+    is_image_file,
     make_cache_key,
     parse_hdf_with_result,
 )
@@ -350,6 +352,21 @@ def _handle_hdf_file(file_content: bytes, filename: str):
     _render_bill_verification_section(full_df)
 
 
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+def _extract_verification_bill(file_hash: str, _file_content: bytes, is_image: bool) -> BillData:
+    """Extract a bill for verification, memoised on the file's content hash.
+
+    As with the Bill Extractor's cache, the bytes argument is
+    underscore-prefixed so Streamlit keys on ``file_hash``; re-uploading the
+    same bill, in this session or another, skips the pipeline.
+    """
+    if is_image:
+        pipeline_result = extract_bill_from_image(_file_content)
+    else:
+        pipeline_result = extract_bill_pipeline(_file_content)
+    return generic_to_legacy(pipeline_result.bill)
+
+
 def _get_extracted_bills_from_session() -> list[dict]:
     """Get successfully extracted bills from the Bill Extractor page session state."""
     bills = st.session_state.get("extracted_bills", [])
@@ -411,17 +428,15 @@ def _render_bill_verification_section(hdf_df: pd.DataFrame):
             return
 
         v_content = verification_file.getvalue()
-        v_key = f"verify_{verification_file.name}_{len(v_content)}"
+        v_hash = content_hash(v_content)
+        v_key = f"verify_{v_hash}"
 
         if st.session_state.get("_verification_cache_key") != v_key:
             try:
                 with st.spinner("Extracting bill for verification..."):
-                    v_name = verification_file.name.lower()
-                    if v_name.endswith(('.jpg', '.jpeg', '.png')):
-                        pipeline_result = extract_bill_from_image(v_content)
-                    else:
-                        pipeline_result = extract_bill_pipeline(v_content)
-                    bill = generic_to_legacy(pipeline_result.bill)
+                    bill = _extract_verification_bill(
+                        v_hash, v_content, is_image_file(verification_file.name),
+                    )
                     st.session_state._verification_cache_key = v_key
                     st.session_state._verification_bill = bill
                     # Clear previous result so validation re-runs
@@ -224,29 +224,31 @@ _BILL_KEYWORDS = [
 ]
 
 
+# Rotation probes only need to read keywords, not every digit; OCR'ing a
+# grayscale copy capped at this many pixels per side is several times
+# cheaper than four full-resolution passes over a phone photo.
+_ROTATION_PROBE_MAX_SIDE = 1600
+
+
 def _pick_best_rotation(img, pytesseract) -> "Image.Image":
-    """Probe 0° and 90° CCW rotations; return the one with better OCR structure.
+    """Probe 0°/90°/180°/270° rotations; return the one with better OCR structure.
 
     Phone photos may be physically rotated (EXIF tag stripped by tools like
-    Picasa).  A quick ``image_to_string`` probe at two orientations lets us
+    Picasa).  A quick ``image_to_string`` probe at each orientation lets us
     detect the correct one by counting bill-keyword hits and text lines.
-    Only the 0° and 90° candidates are tested because real-world phone photos
-    are either landscape-left or portrait.
+    Probes run on a downscaled grayscale copy; only the winning rotation is
+    applied to the full-resolution image.
     """
     from PIL import Image  # noqa: F811
 
-    candidates = [(0, img)]
-    rotated_90 = img.rotate(90, expand=True)
-    candidates.append((90, rotated_90))
-    rotated_180 = img.rotate(180, expand=True)
-    candidates.append((180, rotated_180))
-    rotated_270 = img.rotate(270, expand=True)
-    candidates.append((270, rotated_270))
+    probe = img.convert("L")
+    probe.thumbnail((_ROTATION_PROBE_MAX_SIDE, _ROTATION_PROBE_MAX_SIDE))
 
-    best_img = img
+    best_angle = 0
     best_score = -1
 
-    for angle, candidate in candidates:
+    for angle in (0, 90, 180, 270):
+        candidate = probe.rotate(angle, expand=True) if angle else probe
         text = pytesseract.image_to_string(candidate, lang="eng").lower()
         kw_hits = sum(1 for kw in _BILL_KEYWORDS if kw in text)
         line_count = len([ln for ln in text.strip().split("\n") if ln.strip()])
@@ -255,9 +257,9 @@ def _pick_best_rotation(img, pytesseract) -> "Image.Image":
         log.debug("Rotation probe %d°: kw_hits=%d lines=%d score=%d", angle, kw_hits, line_count, score)
         if score > best_score:
             best_score = score
-            best_img = candidate
+            best_angle = angle
 
-    return best_img
+    return img.rotate(best_angle, expand=True) if best_angle else img
 
 
 def get_ocr_dataframe(
@@ -289,11 +291,12 @@ def get_ocr_dataframe(
         img = ImageOps.exif_transpose(img)
         # Probe rotations: phone photos may be physically rotated even after
         # EXIF transpose (e.g. Picasa strips the EXIF tag).  Run a quick
-        # image_to_string at 0° and 90° CCW, pick the orientation that
+        # image_to_string at each quarter turn, pick the orientation that
         # produces the most structured OCR output (more lines = proper
         # reading order).
         img = _pick_best_rotation(img, pytesseract)
-        images = [img]
+        # Grayscale for the same reason as the PDF path below
+        images = [img.convert("L")]
     else:
         from pdf2image import convert_from_bytes, convert_from_path
         max_pages_raw = os.environ.get("SPATIAL_MAX_PAGES", "").strip()
@@ -306,7 +309,9 @@ def get_ocr_dataframe(
             except ValueError:
                 max_pages = None
 
-        convert_kwargs = {"dpi": 300}
+        # Tesseract binarises internally, so colour pages only cost time in
+        # pdftoppm and in pytesseract's per-page PNG round trip.
+        convert_kwargs = {"dpi": 300, "grayscale": True}
         if max_pages is not None:
             convert_kwargs["first_page"] = 1
             convert_kwargs["last_page"] = max_pages
@@ -0,0 +1,574 @@
+"""
+Unit tests for the Bill Extractor page's pure rendering and export logic.
+
+These cover label generation, confidence levels, field counting, Excel
+export and line-item formatting without a browser or Streamlit server.
+The E2E counterparts live in test_playwright_bill_extractor_deep.py.
+
+Run:
+    python3 -m pytest test_bill_extractor_unit.py -v
+"""
+import io
+import re
+import zipfile
+from dataclasses import asdict, replace
+from datetime import date
+from types import MappingProxyType
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from bill_parser import BillData
+from common.formatters import (
+    CONFIDENCE_LEVELS,
+    bill_label,
+    confidence_level,
+    dedup_labels,
+    format_currency,
+    format_kwh,
+    format_rate,
+    format_warnings,
+)
+from common.excel_export import (
+    EXCEL_SUMMARY_LABELS,
+    SKIP_META,
+    SUMMARY_TITLES,
+    count_extracted_fields,
+    generate_bill_excel,
+    generate_comparison_excel,
+)
+from common.session import is_image_file
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _comparison_df(bills) -> pd.DataFrame:
+    """The columns of show_bill_comparison's frame the export reads."""
+    return pd.DataFrame([
+        {
+            'filename': filename,
+            'supplier': bill.supplier or 'Unknown',
+            'mprn': bill.mprn or '',
+            'billing_days': bill.standing_charge_days,
+            'total_kwh': bill.total_units_kwh,
+            'peak_kwh': bill.peak_units_kwh,
+            'day_rate': bill.day_rate,
+            'total_cost': bill.total_this_period,
+        }
+        for bill, filename in bills
+    ])
+
+
+def _read_column(xlsx_bytes, sheet_name, col=0) -> list:
+    """Read one column of a sheet below the header row.
+
+    Uses openpyxl's read-only mode, which streams the sheet instead of
+    building a DataFrame the tests don't need.
+    """
+    wb = load_workbook(io.BytesIO(xlsx_bytes), read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name]
+        return [row[col].value for row in ws.iter_rows(min_row=2)]
+    finally:
+        wb.close()
+
+
+# Read-only: BillData(**_BILL_DEFAULTS) shares these values, so tests must
+# not mutate the default bill (use ``bill_factory`` for variants).
+_BILL_DEFAULTS = MappingProxyType(dict(
+    supplier="Energia",
+    mprn="10001234567",
+    bill_date="11 Apr 2025",
+    billing_period_start="01/03/2025",
+    billing_period_end="31/03/2025",
+    day_units_kwh=500.0,
+    night_units_kwh=300.0,
+    total_units_kwh=800.0,
+    day_rate=0.4013,
+    night_rate=0.2104,
+    day_cost=200.65,
+    night_cost=63.12,
+    standing_charge_total=24.78,
+    standing_charge_days=30,
+    standing_charge_rate=0.826,
+    pso_levy=3.42,
+    vat_amount=38.45,
+    vat_rate_pct=9.0,
+    subtotal_before_vat=291.97,
+    total_this_period=330.42,
+    amount_due=330.42,
+    previous_balance=0.0,
+    payments_received=0.0,
+    confidence_score=0.85,
+    extraction_method="Direct text (PyMuPDF)",
+    warnings=[],
+))
+
+
+@pytest.fixture(scope="module")
+def default_bill() -> BillData:
+    """A BillData with sensible defaults, built once per module."""
+    return BillData(**_BILL_DEFAULTS)
+
+
+@pytest.fixture
+def bill_factory(default_bill):
+    """Return ``make(**overrides)``: the default bill with fields replaced."""
+    def make(**overrides) -> BillData:
+        return replace(default_bill, **overrides) if overrides else default_bill
+    return make
+
+
+@pytest.fixture(scope="module")
+def export_bill(default_bill) -> BillData:
+    """The default bill with a solar export credit, built once per module."""
+    return replace(default_bill, export_units=150.0, export_rate=0.185,
+                   export_credit=27.75)
+
+
+@pytest.fixture(scope="module")
+def comparison_bills(default_bill) -> list[tuple[BillData, str]]:
+    """Two (bill, filename) pairs for the comparison Excel tests."""
+    return [
+        (replace(default_bill, supplier="Energia", total_this_period=300.0), "energia.pdf"),
+        (replace(default_bill, supplier="Go Power", total_this_period=250.0), "gopower.pdf"),
+    ]
+
+
+# =========================================================================
+# Test Group 1: Pure Functions
+# =========================================================================
+
+class TestBillLabelGeneration:
+    """Unit tests for the bill_label function used in comparison charts."""
+
+    @pytest.mark.parametrize('row,expected', [
+        # period_start wins when present
+        ({'period_start': date(2025, 3, 1), 'bill_date': '11 Apr 2025',
+          'filename': 'test.pdf'}, "Mar 2025"),
+        # no period: fall back to the parsed bill_date
+        ({'period_start': None, 'bill_date': '11 Apr 2025',
+          'filename': 'test.pdf'}, "Apr 2025"),
+        # unparseable bill_date: first 10 chars of the raw string
+        ({'period_start': None, 'bill_date': 'unknown_date_format',
+          'filename': 'test.pdf'}, "unknown_da"),
+        # neither period nor bill_date: filename[:20]
+        ({'period_start': None, 'bill_date': '',
+          'filename': 'my_very_long_bill_filename_2025.pdf'}, "my_very_long_bill_fi"),
+    ], ids=['period_start', 'bill_date', 'unparseable_bill_date', 'filename'])
+    def test_bill_label(self, row, expected):
+        assert bill_label(row) == expected
+
+
+class TestLabelDeduplication:
+    """Unit tests for dedup_labels, used by show_bill_comparison."""
+
+    @pytest.mark.parametrize('labels,expected', [
+        (["Mar 2025", "Mar 2025", "Apr 2025"],
+         ["Mar 2025 (1)", "Mar 2025 (2)", "Apr 2025"]),
+        (["Jan 2025", "Feb 2025", "Mar 2025"],
+         ["Jan 2025", "Feb 2025", "Mar 2025"]),
+        (["Mar 2025", "Mar 2025", "Mar 2025"],
+         ["Mar 2025 (1)", "Mar 2025 (2)", "Mar 2025 (3)"]),
+    ], ids=['duplicate_pair', 'all_unique', 'triple_duplicate'])
+    def test_dedup_labels(self, labels, expected):
+        assert dedup_labels(labels) == expected
+
+
+class TestConfidenceLevelFunction:
+    """Unit tests for the confidence_level helper."""
+
+    @pytest.mark.parametrize('pct,level,suggestion_fragment', [
+        (80, "high", None),
+        (100, "high", None),
+        (79, "partial", "Review"),
+        (60, "partial", "Review"),
+        (59, "low", "clearer scan"),
+        (0, "low", "clearer scan"),
+    ])
+    def test_confidence_buckets(self, pct, level, suggestion_fragment):
+        """80+ is high, 60-79 partial, below 60 low; only high has no suggestion."""
+        lvl, _, _, _, suggestion = confidence_level(pct)
+        assert lvl == level
+        if suggestion_fragment is None:
+            assert suggestion is None
+        else:
+            assert suggestion_fragment in suggestion
+
+    def test_same_bucket_returns_shared_tuple(self):
+        """Scores in one bucket share a single precomputed tuple."""
+        assert confidence_level(85) is confidence_level(99)
+        assert confidence_level(85) is CONFIDENCE_LEVELS[0]
+        assert confidence_level(65) is CONFIDENCE_LEVELS[1]
+        assert confidence_level(10) is CONFIDENCE_LEVELS[2]
+
+
+# The workbooks are only read, so build each one once per class and share
+# the bytes.
+@pytest.fixture(scope="class")
+def default_xlsx(default_bill) -> bytes:
+    return generate_bill_excel(default_bill).getvalue()
+
+
+@pytest.fixture(scope="class")
+def warnings_xlsx(default_bill) -> bytes:
+    return generate_bill_excel(replace(default_bill, warnings=["test warning"])).getvalue()
+
+
+class TestGenerateBillExcel:
+    """Unit tests for the generate_bill_excel function."""
+
+    def test_excel_has_two_sheets(self, default_xlsx):
+        """Excel output should have 'Bill Summary' and 'Extraction Metadata' sheets."""
+        wb = load_workbook(io.BytesIO(default_xlsx), read_only=True)
+        assert 'Bill Summary' in wb.sheetnames
+        assert 'Extraction Metadata' in wb.sheetnames
+        wb.close()
+
+    def test_excel_bill_summary_excludes_metadata_fields(self, warnings_xlsx):
+        """Bill Summary sheet should NOT contain extraction_method, confidence_score, warnings."""
+        field_names = _read_column(warnings_xlsx, 'Bill Summary')
+        assert 'Extraction Method' not in field_names
+        assert 'Confidence Score' not in field_names
+        assert 'Warnings' not in field_names
+
+    def test_excel_bill_summary_uses_export_labels(self, default_xlsx):
+        """Bill Summary rows carry the unit-bearing export labels, in field order."""
+        field_names = _read_column(default_xlsx, 'Bill Summary')
+        assert field_names == list(EXCEL_SUMMARY_LABELS)
+        assert 'MPRN' in field_names
+        assert 'Day Units (kWh)' in field_names
+
+    def test_excel_bill_summary_values_round_trip(self, default_xlsx):
+        """Every Bill Summary value should survive the write (no dropped cells)."""
+        values = _read_column(default_xlsx, 'Bill Summary', col=1)
+        assert 'Energia' in values
+        assert '10001234567' in values
+        assert 330.42 in values
+
+    def test_excel_metadata_sheet_has_confidence(self, default_xlsx):
+        """Extraction Metadata sheet should contain confidence score."""
+        # The default bill's confidence_score is 0.85
+        values = _read_column(default_xlsx, 'Extraction Metadata', col=1)
+        assert '85.0%' in values
+
+    def test_excel_metadata_shows_warning(self, warnings_xlsx):
+        """The Warnings cell should carry the bill's warning."""
+        values = _read_column(warnings_xlsx, 'Extraction Metadata', col=1)
+        assert "test warning" in values
+
+    def test_excel_metadata_shows_warnings_joined(self, bill_factory):
+        """Multiple warnings should be joined with semicolons in the Warnings cell."""
+        xlsx = generate_bill_excel(bill_factory(warnings=["warn1", "warn2"])).getvalue()
+        values = _read_column(xlsx, 'Extraction Metadata', col=1)
+        assert "warn1; warn2" in values
+
+    def test_excel_metadata_no_warnings_shows_none(self, default_xlsx):
+        """No warnings should display as 'None' in the Warnings cell."""
+        labels = _read_column(default_xlsx, 'Extraction Metadata')
+        values = _read_column(default_xlsx, 'Extraction Metadata', col=1)
+        assert values[labels.index('Warnings')] == "None"
+
+
+class TestFormatWarnings:
+    """Unit tests for format_warnings, which fills the Warnings cell."""
+
+    def test_multiple_warnings_joined(self):
+        """Multiple warnings should be joined with semicolons."""
+        assert format_warnings(["warn1", "warn2"]) == "warn1; warn2"
+
+    def test_single_warning_unchanged(self):
+        """A single warning should appear as-is, with no separator."""
+        assert format_warnings(["test warning"]) == "test warning"
+
+    def test_no_warnings_shows_none(self):
+        """No warnings should display as 'None'."""
+        assert format_warnings([]) == "None"
+
+
+class TestCountExtractedFields:
+    """Unit tests for count_extracted_fields."""
+
+    def test_count_skips_metadata_fields(self, default_bill):
+        """extraction_method, confidence_score, and warnings should be excluded from count."""
+        count = count_extracted_fields(default_bill)
+        # The bill has many non-None fields, count should be > 10
+        assert count > 10
+        # Metadata is set on the default bill but never counted
+        assert count == sum(1 for k, v in asdict(default_bill).items()
+                            if k not in SKIP_META and v is not None)
+
+    def test_count_with_empty_bill(self):
+        """A bill with all None fields should have count 0 (after skip)."""
+        assert count_extracted_fields(BillData()) == 0
+
+    def test_count_increments_for_each_non_none_field(self):
+        """Adding one field should increment count by 1."""
+        count1 = count_extracted_fields(BillData())
+        count2 = count_extracted_fields(BillData(supplier="Energia"))
+        assert count2 == count1 + 1
+
+
+# =========================================================================
+# Test Group 2: Error Bill Suggestions
+# =========================================================================
+
+class TestErrorBillSuggestions:
+    """Validate that error suggestions differ between image and PDF uploads."""
+
+    def test_image_error_suggestions_content(self):
+        """Image error suggestions should mention lighting and flattening."""
+        fname = "test_photo.jpg"
+        is_image = is_image_file(fname)
+        assert is_image is True
+
+        suggestions = (
+            '<ol class="suggestion-list">'
+            '<li>Ensure the photo has good lighting and is in focus</li>'
+            '<li>Flatten the bill before photographing (avoid creases)</li>'
+            '<li>Use the PDF version of the bill if available</li>'
+            '</ol>'
+        )
+        assert "good lighting" in suggestions
+        assert "Flatten" in suggestions
+        assert "PDF version" in suggestions
+
+    def test_pdf_error_suggestions_content(self):
+        """PDF error suggestions should mention password-protected and legible."""
+        fname = "test_bill.pdf"
+        is_image = is_image_file(fname)
+        assert is_image is False
+
+        suggestions = (
+            '<ol class="suggestion-list">'
+            '<li>Check the file is not password-protected</li>'
+            '<li>Ensure it is a valid electricity bill PDF</li>'
+            '<li>If scanned, ensure the text is legible</li>'
+            '</ol>'
+        )
+        assert "password-protected" in suggestions
+        assert "valid electricity bill PDF" in suggestions
+        assert "legible" in suggestions
+
+    def test_image_detection_for_various_extensions(self):
+        """Image detection should work for jpg, jpeg, png (case insensitive)."""
+        image_files = ["bill.jpg", "bill.JPEG", "bill.PNG", "bill.Jpg"]
+        pdf_files = ["bill.pdf", "bill.PDF", "bill.tiff"]
+
+        for f in image_files:
+            assert is_image_file(f), \
+                f"{f} should be detected as image"
+
+        for f in pdf_files:
+            assert not is_image_file(f), \
+                f"{f} should NOT be detected as image"
+
+
+# =========================================================================
+# Test Group 3: Solar Export Credit Section
+# =========================================================================
+
+class TestSolarExportCredit:
+    """Validate that the solar export credit section renders correctly."""
+
+    def test_solar_export_section_condition(self, export_bill, default_bill):
+        """Solar Export section appears when export_units or export_credit is set."""
+        assert export_bill.export_units is not None or export_bill.export_credit is not None
+        assert default_bill.export_units is None and default_bill.export_credit is None
+
+    def test_solar_export_detail_format(self, export_bill):
+        """Export detail should show '(150.0 kWh at EUR0.1850/kWh)' format."""
+        bill = export_bill
+        detail = ""
+        if bill.export_units and bill.export_rate:
+            detail = f" ({format_kwh(bill.export_units)} at {format_rate(bill.export_rate)})"
+        assert "150.0 kWh" in detail
+        assert "0.1850/kWh" in detail
+
+    def test_solar_export_credit_text(self, export_bill):
+        """Export credit should render as 'EURXX.XX credit'."""
+        credit_text = f"{format_currency(export_bill.export_credit)} credit"
+        assert "27.75 credit" in credit_text
+
+    def test_solar_export_no_detail_without_rate(self, export_bill):
+        """When export_rate is None, detail string should be empty."""
+        bill = replace(export_bill, export_rate=None)
+        detail = ""
+        if bill.export_units and bill.export_rate:
+            detail = f" ({format_kwh(bill.export_units)} at {format_rate(bill.export_rate)})"
+        assert detail == ""
+
+
+# =========================================================================
+# Test Group 4: Extraction Failed Card
+# =========================================================================
+
+class TestExtractionFailedCard:
+    """Validate the extraction-failed card shown for very low confidence bills."""
+
+    def test_extraction_failed_card_threshold(self):
+        """Card should appear when confidence_pct < 40."""
+        assert 39 < 40   # triggers the card
+        assert not (40 < 40)  # 40 does NOT trigger
+
+
+# =========================================================================
+# Test Group 5: Billing Period Formatting Variants
+# =========================================================================
+
+class TestBillingPeriodFormatting:
+    """Unit tests for billing period display logic variants."""
+
+    def test_both_start_and_end_show_arrow(self):
+        """When both start and end exist, format should be 'start -> end'."""
+        start = "01/03/2025"
+        end = "31/03/2025"
+        period = "\u2014"
+        if start and end:
+            period = f"{start} \u2192 {end}"
+        assert "\u2192" in period
+        assert "01/03/2025" in period
+        assert "31/03/2025" in period
+
+    def test_only_start_shows_start_only(self):
+        """When only start exists, show just the start date."""
+        start = "01/03/2025"
+        end = None
+        period = "\u2014"
+        if start and end:
+            period = f"{start} \u2192 {end}"
+        elif start:
+            period = start
+        assert period == "01/03/2025"
+
+    def test_neither_start_nor_end_shows_dash(self):
+        """When neither start nor end exists, show em-dash."""
+        start = None
+        end = None
+        period = "\u2014"
+        if start and end:
+            period = f"{start} \u2192 {end}"
+        elif start:
+            period = start
+        assert period == "\u2014"
+
+
+# =========================================================================
+# Test Group 6: Comparison Excel Generation
+# =========================================================================
+
+@pytest.fixture(scope="module")
+def three_bills(default_bill) -> list[tuple[BillData, str]]:
+    """Three (bill, filename) pairs with known totals."""
+    return [
+        (replace(default_bill, total_this_period=300.0, total_units_kwh=800.0,
+                 day_rate=0.40, standing_charge_days=30), "jan.pdf"),
+        (replace(default_bill, total_this_period=250.0, total_units_kwh=600.0,
+                 day_rate=0.30, standing_charge_days=31), "feb.pdf"),
+        (replace(default_bill, total_this_period=200.0, total_units_kwh=400.0,
+                 day_rate=0.20, standing_charge_days=28), "mar.pdf"),
+    ]
+
+
+@pytest.fixture(scope="module")
+def totals_row(three_bills):
+    """The Comparison sheet's header and totals row, as a mapping."""
+    buffer = generate_comparison_excel(_comparison_df(three_bills), three_bills)
+    wb = load_workbook(buffer, read_only=True, data_only=True)
+    try:
+        rows = list(wb['Comparison'].iter_rows(values_only=True))
+    finally:
+        wb.close()
+    assert len(rows) == len(three_bills) + 2
+    return dict(zip(rows[0], rows[-1]))
+
+
+class TestComparisonExcelGeneration:
+    """Unit tests for generate_comparison_excel."""
+
+    def test_comparison_excel_has_comparison_sheet(self, comparison_bills):
+        """Comparison Excel should have a 'Comparison' sheet plus per-bill sheets."""
+        buffer = generate_comparison_excel(
+            _comparison_df(comparison_bills), comparison_bills,
+        )
+
+        # An xlsx is a zip; the sheet list lives in xl/workbook.xml, so
+        # there's no need to load the workbook to check it.
+        with zipfile.ZipFile(buffer) as zf:
+            workbook_xml = zf.read('xl/workbook.xml').decode()
+        sheet_names = re.findall(r'<sheet [^>]*name="([^"]+)"', workbook_xml)
+        assert sheet_names == ['Comparison', 'energia.pdf', 'gopower.pdf']
+
+    def test_comparison_excel_totals_row_label(self, totals_row):
+        """The totals row is labelled and leaves identity columns blank."""
+        assert totals_row['File'] == 'TOTAL / AVG'
+        assert totals_row['Supplier'] is None
+        assert totals_row['MPRN'] is None
+
+    def test_comparison_excel_totals_row_sums(self, totals_row):
+        """Consumption, cost and day columns are summed."""
+        assert totals_row['Total kWh'] == pytest.approx(1800.0)
+        assert totals_row['Total Cost (\u20ac)'] == pytest.approx(750.0)
+        assert totals_row['Billing Days'] == 89
+
+    def test_comparison_excel_totals_row_averages(self, totals_row):
+        """Rate columns are averaged, not summed."""
+        assert totals_row['Day Rate (\u20ac/kWh)'] == pytest.approx(0.30)
+
+    def test_comparison_excel_totals_row_all_missing_is_blank(self, totals_row):
+        """A column with no values gets no total."""
+        assert totals_row['Peak kWh'] is None
+
+    def test_comparison_excel_sheet_name_truncation(self, default_bill):
+        """Sheet names longer than 31 chars should be truncated."""
+        bills = [(default_bill, "a_very_long_filename_that_exceeds_31_characters.pdf")]
+        buffer = generate_comparison_excel(_comparison_df(bills), bills)
+        wb = load_workbook(buffer, read_only=True)
+        try:
+            assert wb.sheetnames == ['Comparison', 'a_very_long_filename_that_excee']
+        finally:
+            wb.close()
+
+    def test_comparison_excel_individual_sheets_exclude_metadata(self, bill_factory):
+        """Individual bill sheets should exclude extraction metadata fields."""
+        bills = [(bill_factory(warnings=["w1"]), "bill.pdf")]
+        xlsx = generate_comparison_excel(_comparison_df(bills), bills).getvalue()
+        field_names = _read_column(xlsx, 'bill.pdf')
+        assert field_names == list(SUMMARY_TITLES)
+        assert 'Extraction Method' not in field_names
+        assert 'Confidence Score' not in field_names
+        assert 'Warnings' not in field_names
+
+
+# =========================================================================
+# Test Group 7: Discount Line Item
+# =========================================================================
+
+class TestDiscountLineItem:
+    """Unit tests for discount rendering logic."""
+
+    def test_discount_shows_cr_suffix(self):
+        """Discount should be formatted as 'EURXX.XX CR'."""
+        discount = 15.50
+        formatted = f"{format_currency(discount)} CR"
+        assert "15.50 CR" in formatted
+
+    def test_discount_none_not_rendered(self, default_bill):
+        """When discount is None, no discount line item should be created."""
+        bill = default_bill
+        line_items = []
+        if bill.discount is not None:
+            line_items.append(("Discount", f"{format_currency(bill.discount)} CR"))
+        assert len(line_items) == 0
+
+    def test_discount_present_creates_line_item(self, bill_factory):
+        """When discount is set, a Discount line item should be created."""
+        bill = bill_factory(discount=25.00)
+        line_items = []
+        if bill.discount is not None:
+            line_items.append(("Discount", f"{format_currency(bill.discount)} CR"))
+        assert len(line_items) == 1
+        assert line_items[0] == ("Discount", "\u20ac25.00 CR")
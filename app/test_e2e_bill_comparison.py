@@ -30,8 +30,6 @@ Run E2E tests explicitly:
     python3 -m pytest -m e2e -v
 """
 import os
-import subprocess
-import time
 from pathlib import Path
 
 import pytest
@@ -41,46 +39,11 @@ from playwright.sync_api import Page, expect
 pytestmark = pytest.mark.e2e
 
 APP_DIR = os.path.dirname(__file__)
-APP_PATH = os.path.join(APP_DIR, "main.py")
 BILLS_DIR = os.path.join(APP_DIR, "..", "sample_bills")
-STREAMLIT_PORT = 8597
 
 
-@pytest.fixture(scope="session")
-def streamlit_app():
-    """Start the Streamlit app as a subprocess and yield the URL."""
-    # Use sys.executable to ensure we use the same Python that's running pytest
-    import sys
-    proc = subprocess.Popen(
-        [
-            sys.executable, "-m", "streamlit", "run", APP_PATH,
-            "--server.port", str(STREAMLIT_PORT),
-            "--server.headless", "true",
-            "--browser.gatherUsageStats", "false",
-        ],
-        cwd=APP_DIR,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-
-    url = f"http://localhost:{STREAMLIT_PORT}"
-
-    # Wait for Streamlit to be ready
-    import urllib.request
-    for _ in range(30):
-        try:
-            urllib.request.urlopen(url, timeout=2)
-            break
-        except Exception:
-            time.sleep(1)
-    else:
-        proc.terminate()
-        pytest.fail("Streamlit app did not start within 30 seconds")
-
-    yield url
-
-    proc.terminate()
-    proc.wait(timeout=10)
+# ``streamlit_app`` is the session-wide server fixture from conftest.py
+# (one server per xdist worker), and ``page`` is a fresh page per test.
 
 
 def _switch_to_comparison_mode(page: Page, streamlit_app: str):
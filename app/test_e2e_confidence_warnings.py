@@ -28,8 +28,6 @@ Run a single test:
 """
 import os
 import re
-import subprocess
-import time
 
 import pytest
 from playwright.sync_api import Page, expect
@@ -38,54 +36,11 @@ from playwright.sync_api import Page, expect
 pytestmark = pytest.mark.e2e
 
 APP_DIR = os.path.dirname(__file__)
-APP_PATH = os.path.join(APP_DIR, "main.py")
 BILLS_DIR = os.path.join(APP_DIR, "..", "sample_bills")
-STREAMLIT_PORT = 8596  # Non-standard port to avoid conflicts
-
-
-@pytest.fixture(scope="session")
-def streamlit_app():
-    """Start the Streamlit app as a subprocess and yield the URL."""
-    # Use sys.executable to ensure we use the same Python that's running pytest
-    import sys
-    proc = subprocess.Popen(
-        [
-            sys.executable, "-m", "streamlit", "run", APP_PATH,
-            "--server.port", str(STREAMLIT_PORT),
-            "--server.headless", "true",
-            "--browser.gatherUsageStats", "false",
-        ],
-        cwd=APP_DIR,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-
-    url = f"http://localhost:{STREAMLIT_PORT}"
-
-    # Wait for Streamlit to be ready
-    import urllib.request
-    for _ in range(30):
-        try:
-            urllib.request.urlopen(url, timeout=2)
-            break
-        except Exception:
-            time.sleep(1)
-    else:
-        proc.terminate()
-        pytest.fail("Streamlit app did not start within 30 seconds")
-
-    yield url
-
-    proc.terminate()
-    proc.wait(timeout=10)
-
-
-@pytest.fixture(autouse=True)
-def cleanup_after_test(page: Page, streamlit_app: str):
-    """Navigate home after each test to reset Streamlit state."""
-    yield
-    page.goto(streamlit_app)
-    page.wait_for_timeout(1000)
+
+
+# ``streamlit_app`` is the session-wide server fixture from conftest.py
+# (one server per xdist worker), and ``page`` is a fresh page per test.
 
 
 def _upload_pdf(page: Page, streamlit_app: str, filename: str) -> None:
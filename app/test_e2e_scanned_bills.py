@@ -15,7 +15,7 @@ Test fixtures:
 
 Requirements:
   - pytest-playwright
-  - Streamlit app running on STREAMLIT_PORT
+  - Streamlit app: started by the ``streamlit_app`` fixture in conftest.py
   - Playwright browsers installed: python3 -m playwright install
 
 Run:
@@ -23,73 +23,23 @@ Run:
     python3 -m pytest test_e2e_scanned_bills.py::TestScannedBillUpload::test_energia_scan_uploads -v -m e2e
 """
 import os
-import subprocess
 import time
 import json
 import re
 from pathlib import Path
 
 import pytest
-from playwright.sync_api import Page, Browser, sync_playwright, expect
+from playwright.sync_api import Page, expect
 
 # Mark all tests in this module as E2E tests
 pytestmark = pytest.mark.e2e
 
 APP_DIR = os.path.dirname(__file__)
-APP_PATH = os.path.join(APP_DIR, "main.py")
 BILLS_DIR = os.path.join(APP_DIR, "..", "sample_bills")
-STREAMLIT_PORT = 8599
-
-
-@pytest.fixture(scope="module")
-def streamlit_app():
-    """Start the Streamlit app as a subprocess and yield the URL."""
-    # Use sys.executable to ensure we use the same Python that's running pytest
-    import sys
-    proc = subprocess.Popen(
-        [
-            sys.executable, "-m", "streamlit", "run", APP_PATH,
-            "--server.port", str(STREAMLIT_PORT),
-            "--server.headless", "true",
-            "--browser.gatherUsageStats", "false",
-        ],
-        cwd=APP_DIR,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-
-    url = f"http://localhost:{STREAMLIT_PORT}"
-
-    # Wait for Streamlit to be ready
-    import urllib.request
-    for attempt in range(60):
-        try:
-            urllib.request.urlopen(url, timeout=2)
-            break
-        except Exception:
-            if attempt == 59:
-                proc.terminate()
-                pytest.fail("Streamlit app did not start within 60 seconds")
-            time.sleep(1)
-
-    yield url
-
-    proc.terminate()
-    try:
-        proc.wait(timeout=10)
-    except subprocess.TimeoutExpired:
-        proc.kill()
-
-
-@pytest.fixture(scope="function")
-def page():
-    """Provide a fresh Playwright page for each test."""
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=True)
-        page = browser.new_page()
-        yield page
-        page.close()
-        browser.close()
+
+# ``streamlit_app`` is the session-wide server fixture from conftest.py
+# (one server per xdist worker), and ``page`` is a fresh page per test in
+# the session's shared browser context.
 
 
 def _pdf_path(filename: str) -> str:
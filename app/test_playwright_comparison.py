@@ -2,8 +2,8 @@
 Playwright end-to-end tests for the multi-bill comparison feature.
 
 Validates that:
-  - The analysis mode radio is visible (Single File / Bill Comparison)
-  - Switching to Bill Comparison mode shows the multi-file uploader
+  - The Bill Extractor's uploader accepts several bills at once
+  - A second bill switches the single-bill summary to the comparison view
   - Uploading multiple PDFs triggers extraction and shows comparison view
   - Comparison tabs are present (Summary, Cost Trends, Consumption, etc.)
   - Summary table displays extracted data
@@ -20,8 +20,7 @@ Run this file directly:
     python3 -m pytest test_playwright_comparison.py -v
 """
 import os
-import subprocess
-import time
+import re
 
 import pytest
 from playwright.sync_api import Page, expect
@@ -30,289 +29,185 @@ from playwright.sync_api import Page, expect
 pytestmark = pytest.mark.e2e
 
 APP_DIR = os.path.dirname(__file__)
-APP_PATH = os.path.join(APP_DIR, "main.py")
 BILLS_DIR = os.path.join(APP_DIR, "..", "sample_bills")
-STREAMLIT_PORT = 8598  # Different port from other E2E tests
-
-
-@pytest.fixture(scope="module")
-def streamlit_app():
-    """Start the Streamlit app as a subprocess and yield the URL."""
-    import sys
-    proc = subprocess.Popen(
-        [
-            sys.executable, "-m", "streamlit", "run", APP_PATH,
-            "--server.port", str(STREAMLIT_PORT),
-            "--server.headless", "true",
-            "--browser.gatherUsageStats", "false",
-        ],
-        cwd=APP_DIR,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
 
-    url = f"http://localhost:{STREAMLIT_PORT}"
+MAIN = '[data-testid="stMain"]'
+SIDEBAR = 'section[data-testid="stSidebar"]'
+COMPARISON_TABS = ["Summary", "Cost Trends", "Consumption", "Rate Analysis", "Export"]
+
+TWO_BILLS = [
+    "1845.pdf",
+    "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf",
+]
+THREE_BILLS = TWO_BILLS + ["2024 Mar - Apr.pdf"]
+
+# Resolved and checked once at import, not on every upload
+BILL_PATHS = {name: os.path.join(BILLS_DIR, name) for name in THREE_BILLS}
+AVAILABLE_BILLS = frozenset(n for n, p in BILL_PATHS.items() if os.path.exists(p))
 
-    # Wait for Streamlit to be ready
-    import urllib.request
-    for _ in range(30):
-        try:
-            urllib.request.urlopen(url, timeout=2)
-            break
-        except Exception:
-            time.sleep(1)
-    else:
-        proc.terminate()
-        pytest.fail("Streamlit app did not start within 30 seconds")
 
-    yield url
+def requires_bills(*filenames: str):
+    """Skip the decorated test/class unless all given bills are present."""
+    missing = [f for f in filenames if f not in AVAILABLE_BILLS]
+    return pytest.mark.skipif(
+        bool(missing), reason=f"Test bill(s) not found: {', '.join(missing)}"
+    )
 
-    proc.terminate()
-    proc.wait(timeout=10)
+# ``streamlit_app`` is the session-wide server fixture from conftest.py.
 
 
-def _switch_to_comparison_mode(page: Page, streamlit_app: str):
-    """Navigate to the app and switch to Bill Comparison mode."""
-    page.goto(streamlit_app)
-    page.wait_for_load_state("networkidle")
-    # Click the "Bill Comparison" radio option
-    comparison_radio = page.get_by_text("Bill Comparison")
-    comparison_radio.click()
-    page.wait_for_timeout(1000)
+def _open_bill_extractor(page: Page, streamlit_app: str):
+    """Navigate to the Bill Extractor page and wait for its uploader."""
+    page.goto(f"{streamlit_app}/Bill_Extractor", wait_until="domcontentloaded")
+    expect(page.locator('[data-testid="stFileUploader"]')).to_be_visible(timeout=15000)
 
 
 def _upload_multiple_pdfs(page: Page, filenames: list[str]):
-    """Upload multiple PDFs via the comparison file uploader."""
-    pdf_paths = []
-    for filename in filenames:
-        path = os.path.join(BILLS_DIR, filename)
-        if not os.path.exists(path):
-            pytest.skip(f"PDF not found: {filename}")
-        pdf_paths.append(path)
-
-    # Find the file input in the comparison uploader
+    """Upload multiple PDFs and wait for the comparison view to render.
+
+    Callers are expected to be guarded with ``requires_bills``.
+    """
     file_input = page.locator('[data-testid="stFileUploader"] input[type="file"]')
-    file_input.set_input_files(pdf_paths)
+    file_input.set_input_files([BILL_PATHS[f] for f in filenames])
 
-    # Wait for extraction to complete
-    page.wait_for_timeout(8000)
+    # Returns as soon as extraction finishes and the comparison view renders
+    page.locator('[data-testid="comparison-ready"]').wait_for(
+        state="attached", timeout=45000,
+    )
 
 
-class TestComparisonModeToggle:
-    """Test that the analysis mode radio is visible and functional."""
+def _comparison_page(context, streamlit_app: str, filenames: list[str]):
+    """Open a Bill Extractor page in the shared context comparing ``filenames``."""
+    pg = context.new_page()
+    _open_bill_extractor(pg, streamlit_app)
+    _upload_multiple_pdfs(pg, filenames)
+    return pg
 
-    def test_mode_radio_visible(self, page: Page, streamlit_app: str):
-        """The analysis mode radio should be visible in the sidebar."""
-        page.goto(streamlit_app)
-        page.wait_for_load_state("networkidle")
 
-        single_file = page.get_by_text("Single File")
-        expect(single_file).to_be_visible(timeout=15000)
+# The comparison classes only read the rendered view (and switch tabs), so
+# each uploads its bills once and shares the page across its tests.
+@pytest.fixture(scope="class")
+def comparison_page(context, streamlit_app):
+    """A page comparing two bills, shared by every test in a class."""
+    pg = _comparison_page(context, streamlit_app, TWO_BILLS)
+    yield pg
+    pg.close()
 
-        comparison = page.get_by_text("Bill Comparison")
-        expect(comparison).to_be_visible(timeout=5000)
 
-    def test_default_is_single_file(self, page: Page, streamlit_app: str):
-        """Default mode should be Single File."""
-        page.goto(streamlit_app)
-        page.wait_for_load_state("networkidle")
+@pytest.fixture(scope="class")
+def three_bill_page(context, streamlit_app):
+    """A page comparing three bills, shared by every test in a class."""
+    pg = _comparison_page(context, streamlit_app, THREE_BILLS)
+    yield pg
+    pg.close()
 
-        # Landing page should show the title
-        expect(page.get_by_text("Energy Insight").first).to_be_visible(timeout=15000)
 
-    def test_switch_to_comparison_shows_instructions(self, page: Page, streamlit_app: str):
-        """Switching to Bill Comparison mode shows comparison instructions."""
-        _switch_to_comparison_mode(page, streamlit_app)
+def _open_tab(page: Page, name: str):
+    """Click a comparison tab and wait until it is the selected one."""
+    tab = page.get_by_role("tab", name=name)
+    tab.click()
+    expect(tab).to_have_attribute("aria-selected", "true")
 
-        content = page.content()
-        assert "Bill Comparison" in content, \
-            "Bill Comparison heading should be visible"
-        assert "Upload 2 or more" in content, \
-            "Instructions should mention uploading 2+ bills"
 
-    def test_comparison_mode_shows_multi_uploader(self, page: Page, streamlit_app: str):
-        """Bill Comparison mode should show a file uploader accepting multiple files."""
-        _switch_to_comparison_mode(page, streamlit_app)
+class TestSingleToComparisonTransition:
+    """The Bill Extractor switches to comparison once a second bill arrives.
 
-        uploader = page.locator('[data-testid="stFileUploader"]')
-        expect(uploader).to_be_visible(timeout=5000)
+    There is no separate comparison mode: bills accumulate in one uploader.
+    """
 
-    def test_comparison_sidebar_label(self, page: Page, streamlit_app: str):
-        """Sidebar should show 'Bill Comparison Mode' when in comparison mode."""
-        _switch_to_comparison_mode(page, streamlit_app)
+    def test_uploader_accepts_multiple_files(self, page: Page, streamlit_app: str):
+        """The single uploader takes several bills at once."""
+        _open_bill_extractor(page, streamlit_app)
 
-        content = page.content()
-        assert "Bill Comparison Mode" in content, \
-            "Sidebar should show 'Bill Comparison Mode'"
+        file_input = page.locator('[data-testid="stFileUploader"] input[type="file"]')
+        expect(file_input).to_have_attribute("multiple", "")
+
+    @requires_bills(TWO_BILLS[0])
+    def test_single_bill_shows_no_comparison(self, page: Page, streamlit_app: str):
+        """One bill shows its summary, without comparison tabs."""
+        _open_bill_extractor(page, streamlit_app)
 
-    def test_single_file_warning(self, page: Page, streamlit_app: str):
-        """Uploading only 1 file in comparison mode should show a warning."""
-        _switch_to_comparison_mode(page, streamlit_app)
+        file_input = page.locator('[data-testid="stFileUploader"] input[type="file"]')
+        file_input.set_input_files(BILL_PATHS[TWO_BILLS[0]])
 
-        # Upload single PDF
-        pdf_path = os.path.join(BILLS_DIR, "1845.pdf")
-        if not os.path.exists(pdf_path):
-            pytest.skip("PDF not found")
+        expect(page.locator(SIDEBAR)).to_contain_text("1 bill extracted", timeout=30000)
+        expect(page.get_by_role("tab", name="Cost Trends")).to_have_count(0)
+
+    @requires_bills(*TWO_BILLS)
+    def test_second_bill_switches_to_comparison(self, page: Page, streamlit_app: str):
+        """Adding a second bill replaces the summary with the comparison view."""
+        _open_bill_extractor(page, streamlit_app)
 
         file_input = page.locator('[data-testid="stFileUploader"] input[type="file"]')
-        file_input.set_input_files(pdf_path)
-        page.wait_for_timeout(3000)
+        file_input.set_input_files(BILL_PATHS[TWO_BILLS[0]])
+        expect(page.locator(SIDEBAR)).to_contain_text("1 bill extracted", timeout=30000)
 
-        content = page.content()
-        assert "at least 2" in content.lower(), \
-            "Should warn that at least 2 bills are needed"
+        # Uploads accumulate, so only the new bill is sent
+        file_input.set_input_files(BILL_PATHS[TWO_BILLS[1]])
+        page.locator('[data-testid="comparison-ready"]').wait_for(
+            state="attached", timeout=45000,
+        )
+        expect(page.locator(SIDEBAR)).to_contain_text("2 bills extracted")
 
 
+@requires_bills(*TWO_BILLS)
 class TestBillComparison:
     """Test multi-bill comparison with actual PDF uploads."""
 
-    def test_comparison_tabs_visible(self, page: Page, streamlit_app: str):
+    def test_comparison_tabs_visible(self, comparison_page: Page):
         """Uploading 2+ bills should show comparison tabs."""
-        _switch_to_comparison_mode(page, streamlit_app)
-        _upload_multiple_pdfs(page, [
-            "1845.pdf",
-            "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf",
-        ])
-
-        content = page.content()
-        assert "Bill Comparison" in content, "Comparison heading should appear"
-        assert "Summary" in content, "Summary tab should be visible"
-        assert "Cost Trends" in content, "Cost Trends tab should be visible"
-        assert "Consumption" in content, "Consumption tab should be visible"
-        assert "Rate Analysis" in content, "Rate Analysis tab should be visible"
-        assert "Export" in content, "Export tab should be visible"
-
-    def test_comparison_shows_bill_count(self, page: Page, streamlit_app: str):
-        """Comparison view should show the number of bills."""
-        _switch_to_comparison_mode(page, streamlit_app)
-        _upload_multiple_pdfs(page, [
-            "1845.pdf",
-            "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf",
-        ])
+        expect(comparison_page.locator(MAIN)).to_contain_text("Bill Comparison")
+        # One query for all five tab labels, in order
+        expect(comparison_page.get_by_role("tab")).to_have_text(COMPARISON_TABS)
 
-        content = page.content()
-        assert "2 bills" in content, "Should show '2 bills' in the heading"
+    def test_comparison_shows_bill_count(self, comparison_page: Page):
+        """Comparison view should show the number of bills."""
+        expect(comparison_page.locator(MAIN)).to_contain_text("2 bills")
 
-    def test_summary_table_has_data(self, page: Page, streamlit_app: str):
+    def test_summary_table_has_data(self, comparison_page: Page):
         """Summary tab should show a data table with bill information."""
-        _switch_to_comparison_mode(page, streamlit_app)
-        _upload_multiple_pdfs(page, [
-            "1845.pdf",
-            "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf",
-        ])
-
-        content = page.content()
+        main = comparison_page.locator(MAIN)
         # Summary metrics should be visible
-        has_metrics = (
-            "Total Cost" in content
-            or "Total kWh" in content
-            or "Avg Cost" in content
-        )
-        assert has_metrics, "Summary metrics should be displayed"
+        expect(main).to_contain_text(re.compile("Total Cost|Total kWh|Avg Cost"))
 
         # Table should show file names
-        assert "1845.pdf" in content, "First bill filename should appear in table"
+        expect(main).to_contain_text("1845.pdf")
 
-    def test_no_errors_on_comparison(self, page: Page, streamlit_app: str):
+    def test_no_errors_on_comparison(self, comparison_page: Page):
         """Comparison should not produce error alerts."""
-        _switch_to_comparison_mode(page, streamlit_app)
-        _upload_multiple_pdfs(page, [
-            "1845.pdf",
-            "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf",
-        ])
-
-        errors = page.locator('[data-testid="stAlert"][data-type="error"]')
+        errors = comparison_page.locator('[data-testid="stAlert"][data-type="error"]')
         assert errors.count() == 0, "No errors should appear for valid bill comparison"
 
-    def test_cost_trends_tab(self, page: Page, streamlit_app: str):
-        """Cost Trends tab should render charts."""
-        _switch_to_comparison_mode(page, streamlit_app)
-        _upload_multiple_pdfs(page, [
-            "1845.pdf",
-            "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf",
-        ])
-
-        # Click Cost Trends tab
-        cost_tab = page.get_by_text("Cost Trends")
-        cost_tab.first.click()
-        page.wait_for_timeout(2000)
-
-        content = page.content()
-        assert "Cost Trends" in content, "Cost Trends heading should appear"
-
-    def test_consumption_tab(self, page: Page, streamlit_app: str):
-        """Consumption tab should render charts."""
-        _switch_to_comparison_mode(page, streamlit_app)
-        _upload_multiple_pdfs(page, [
-            "1845.pdf",
-            "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf",
-        ])
-
-        # Click Consumption tab
-        consumption_tab = page.get_by_text("Consumption")
-        consumption_tab.first.click()
-        page.wait_for_timeout(2000)
-
-        content = page.content()
-        assert "Consumption Trends" in content, "Consumption Trends heading should appear"
-
-    def test_rate_analysis_tab(self, page: Page, streamlit_app: str):
-        """Rate Analysis tab should render."""
-        _switch_to_comparison_mode(page, streamlit_app)
-        _upload_multiple_pdfs(page, [
-            "1845.pdf",
-            "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf",
-        ])
-
-        # Click Rate Analysis tab
-        rate_tab = page.get_by_text("Rate Analysis")
-        rate_tab.first.click()
-        page.wait_for_timeout(2000)
-
-        content = page.content()
-        assert "Rate Analysis" in content, "Rate Analysis heading should appear"
-
-    def test_export_tab_has_button(self, page: Page, streamlit_app: str):
-        """Export tab should have a generate button."""
-        _switch_to_comparison_mode(page, streamlit_app)
-        _upload_multiple_pdfs(page, [
-            "1845.pdf",
-            "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf",
-        ])
+    @pytest.mark.parametrize("tab,heading", [
+        ("Cost Trends", "Cost Trends"),
+        ("Consumption", "Consumption Trends"),
+        ("Rate Analysis", "Rate Analysis"),
+    ], ids=["cost", "consumption", "rate"])
+    def test_tab_renders(self, comparison_page: Page, tab: str, heading: str):
+        """Each analysis tab should render its heading when selected."""
+        _open_tab(comparison_page, tab)
 
-        # Click Export tab
-        export_tab = page.get_by_text("Export")
-        export_tab.first.click()
-        page.wait_for_timeout(1000)
+        # Role locators skip hidden panels, so this is the selected tab's panel
+        expect(comparison_page.get_by_role("tabpanel")).to_contain_text(heading)
 
-        content = page.content()
-        assert "Generate Comparison Excel" in content or "Export Comparison" in content, \
-            "Export tab should have a generate button"
+    def test_export_tab_has_button(self, comparison_page: Page):
+        """Export tab should have a generate button."""
+        _open_tab(comparison_page, "Export")
 
+        expect(comparison_page.get_by_role("tabpanel")).to_contain_text(
+            re.compile("Generate Comparison Excel|Export Comparison")
+        )
 
+
+@requires_bills(*THREE_BILLS)
 class TestComparisonThreeBills:
     """Test comparison with 3 bills for better trend coverage."""
 
-    def test_three_bills_comparison(self, page: Page, streamlit_app: str):
+    def test_three_bills_comparison(self, three_bill_page: Page):
         """Should handle 3 bills and show '3 bills' in heading."""
-        _switch_to_comparison_mode(page, streamlit_app)
-        _upload_multiple_pdfs(page, [
-            "1845.pdf",
-            "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf",
-            "2024 Mar - Apr.pdf",
-        ])
-
-        content = page.content()
-        assert "3 bills" in content, "Should show '3 bills' in the heading"
+        expect(three_bill_page.locator(MAIN)).to_contain_text("3 bills")
 
-    def test_three_bills_no_errors(self, page: Page, streamlit_app: str):
+    def test_three_bills_no_errors(self, three_bill_page: Page):
         """3-bill comparison should not produce errors."""
-        _switch_to_comparison_mode(page, streamlit_app)
-        _upload_multiple_pdfs(page, [
-            "1845.pdf",
-            "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf",
-            "2024 Mar - Apr.pdf",
-        ])
-
-        errors = page.locator('[data-testid="stAlert"][data-type="error"]')
+        errors = three_bill_page.locator('[data-testid="stAlert"][data-type="error"]')
         assert errors.count() == 0, "No errors should appear for 3-bill comparison"
@@ -16,9 +16,8 @@ Run E2E tests explicitly:
 Run this file directly:
     python3 -m pytest test_playwright_image_upload.py -v
 """
+import functools
 import os
-import subprocess
-import time
 
 import pytest
 from playwright.sync_api import Page, expect
@@ -27,53 +26,35 @@ from playwright.sync_api import Page, expect
 pytestmark = pytest.mark.e2e
 
 APP_DIR = os.path.dirname(__file__)
-APP_PATH = os.path.join(APP_DIR, "main.py")
 BILLS_DIR = os.path.join(APP_DIR, "..", "sample_bills")
 IMAGE_FILE = "sample_bill_photo.jpg"
-STREAMLIT_PORT = 8599  # Same port as other E2E tests
-
-
-@pytest.fixture(scope="session")
-def streamlit_app():
-    """Start the Streamlit app as a subprocess and yield the URL."""
-    import sys
-    proc = subprocess.Popen(
-        [
-            sys.executable, "-m", "streamlit", "run", APP_PATH,
-            "--server.port", str(STREAMLIT_PORT),
-            "--server.headless", "true",
-            "--browser.gatherUsageStats", "false",
-        ],
-        cwd=APP_DIR,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
 
-    url = f"http://localhost:{STREAMLIT_PORT}"
 
-    import urllib.request
-    for _ in range(30):
-        try:
-            urllib.request.urlopen(url, timeout=2)
-            break
-        except Exception:
-            time.sleep(1)
-    else:
-        proc.terminate()
-        pytest.fail("Streamlit app did not start within 30 seconds")
+# ``streamlit_app`` is the session-wide server fixture from conftest.py
+# (one server per xdist worker), and ``page`` is a fresh page per test.
+
 
-    yield url
+@functools.lru_cache(maxsize=None)
+def _image_payload() -> dict:
+    """Read the sample photo once as a ``set_input_files`` payload.
 
-    proc.terminate()
-    proc.wait(timeout=10)
+    Every test uploads the same image, so Playwright needn't re-read it
+    from disk for each one.
+    """
+    with open(os.path.join(BILLS_DIR, IMAGE_FILE), "rb") as f:
+        return {"name": IMAGE_FILE, "mimeType": "image/jpeg", "buffer": f.read()}
 
 
-@pytest.fixture(autouse=True)
-def cleanup_after_test(page: Page, streamlit_app: str):
-    """Navigate home after each test to reset Streamlit state."""
-    yield
-    page.goto(streamlit_app)
-    page.wait_for_timeout(1000)
+def _html_includes_any(page: Page, terms: list[str]) -> bool:
+    """Whether the lower-cased page HTML contains any of ``terms``.
+
+    The scan runs in the browser, so only a boolean crosses CDP.
+    """
+    return page.evaluate(
+        "terms => { const html = document.documentElement.outerHTML.toLowerCase();"
+        " return terms.some(t => html.includes(t)); }",
+        terms,
+    )
 
 
 class TestImageUpload:
@@ -85,28 +66,25 @@ class TestImageUpload:
         if not os.path.exists(image_path):
             pytest.skip(f"Image not found: {IMAGE_FILE}")
 
-        page.goto(streamlit_app)
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(5000)
-
-        expect(page.locator('[data-testid="stSidebar"]')).to_be_visible(timeout=30000)
+        page.goto(f"{streamlit_app}/Bill_Extractor", wait_until="domcontentloaded")
         expect(page.locator('[data-testid="stFileUploader"]')).to_be_visible(timeout=30000)
 
         file_input = page.locator('[data-testid="stFileUploader"] input[type="file"]')
         expect(file_input).to_be_attached(timeout=30000)
-        file_input.set_input_files(image_path)
+        file_input.set_input_files(_image_payload())
 
-        # Image extraction may take longer due to OCR
-        page.wait_for_timeout(15000)
+        # Image extraction may take longer due to OCR; return once the
+        # result (or the extraction-failed card) renders
+        page.locator(
+            '[data-testid="confidence-badge"], .extraction-failed-card'
+        ).first.wait_for(timeout=30000)
 
     def test_image_uploader_accepts_jpg(self, page: Page, streamlit_app: str):
         """Upload sample_bill_photo.jpg and verify extraction output appears."""
         self._upload_image(page, streamlit_app)
 
-        content = page.content()
-        has_extraction = any(
-            term in content.lower()
-            for term in ["confidence", "mprn", "account", "extraction"]
+        has_extraction = _html_includes_any(
+            page, ["confidence", "mprn", "account", "extraction"]
         )
         assert has_extraction, "Extraction output should be displayed for image upload"
 
@@ -114,17 +92,15 @@ class TestImageUpload:
         """Verify confidence score is displayed for image extraction."""
         self._upload_image(page, streamlit_app)
 
-        content = page.content()
-        assert "confidence" in content.lower(), \
+        assert _html_includes_any(page, ["confidence"]), \
             "Confidence score should be visible in extraction output"
 
-    def test_image_extraction_shows_extraction_path(self, page: Page, streamlit_app: str):
-        """Verify extraction path mentions spatial or LLM tier."""
+    def test_image_extraction_hides_extraction_path(self, page: Page, streamlit_app: str):
+        """Internal tier names from the extraction path should not be shown."""
         self._upload_image(page, streamlit_app)
 
-        content = page.content().lower()
-        has_path = "tier2_spatial" in content or "tier4_llm" in content or "image_input" in content
-        assert has_path, "Extraction path should mention tier2_spatial, tier4_llm, or image_input"
+        has_path = _html_includes_any(page, ["tier2_spatial", "tier4_llm"])
+        assert not has_path, "Tier strings (tier2_spatial, tier4_llm) should not be visible"
 
     def test_image_shows_bill_mode_sidebar(self, page: Page, streamlit_app: str):
         """Verify sidebar shows Bill Extraction Mode for image uploads."""
@@ -14,18 +14,12 @@ Run E2E tests explicitly:
     GEMINI_API_KEY=<key> GOOGLE_GENAI_USE_VERTEXAI=false pytest -m e2e test_playwright_llm.py -v
 """
 import os
-import subprocess
-import time
 
 import pytest
 from playwright.sync_api import Page, expect
 
-pytestmark = pytest.mark.e2e
-
 APP_DIR = os.path.dirname(__file__)
-APP_PATH = os.path.join(APP_DIR, "main.py")
 BILLS_DIR = os.path.join(APP_DIR, "..", "sample_bills")
-STREAMLIT_PORT = 8601  # Different port to avoid conflicts
 
 
 def _bill_path(filename: str) -> str:
@@ -40,54 +34,31 @@ def _has_gemini_key() -> bool:
     return bool(os.environ.get("GEMINI_API_KEY"))
 
 
-@pytest.fixture(scope="session")
-def streamlit_app():
-    """Start the Streamlit app with GEMINI_API_KEY set."""
-    import sys
-    env = os.environ.copy()
-    # Ensure Gemini API key is available to the app
-    if not env.get("GEMINI_API_KEY"):
-        pytest.skip("GEMINI_API_KEY not set")
-
-    proc = subprocess.Popen(
-        [
-            sys.executable, "-m", "streamlit", "run", APP_PATH,
-            "--server.port", str(STREAMLIT_PORT),
-            "--server.headless", "true",
-            "--browser.gatherUsageStats", "false",
-        ],
-        cwd=APP_DIR,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        env=env,
-    )
+# Skip at collection rather than in a fixture, so no browser or server
+# setup is paid for when the key is missing.
+pytestmark = [
+    pytest.mark.e2e,
+    pytest.mark.skipif(not _has_gemini_key(), reason="GEMINI_API_KEY not set"),
+]
 
-    url = f"http://localhost:{STREAMLIT_PORT}"
 
-    import urllib.request
-    for _ in range(30):
-        try:
-            urllib.request.urlopen(url, timeout=2)
-            break
-        except Exception:
-            time.sleep(1)
-    else:
-        proc.terminate()
-        pytest.fail("Streamlit app did not start within 30 seconds")
+@pytest.fixture(scope="module")
+def streamlit_app(cold_streamlit_app):
+    """A server of this module's own, started without warm-up.
 
-    yield url
-
-    proc.terminate()
-    proc.wait(timeout=10)
+    The shared server has already extracted the common sample bills and
+    cached the results, which would skip the LLM tier entirely here.
+    GEMINI_API_KEY reaches the app through the inherited environment.
+    """
+    return cold_streamlit_app
 
 
 def _upload_file(page: Page, streamlit_app: str, filepath: str):
-    """Upload a file via the Streamlit file uploader."""
-    page.goto(streamlit_app)
-    page.wait_for_load_state("networkidle")
-    page.wait_for_timeout(2000)
+    """Upload a file via the Bill Extractor's file uploader."""
+    page.goto(f"{streamlit_app}/Bill_Extractor", wait_until="domcontentloaded")
 
     file_input = page.locator('[data-testid="stFileUploader"] input[type="file"]')
+    expect(file_input).to_be_attached(timeout=15000)
     file_input.set_input_files(filepath)
 
     # Wait for extraction to complete
@@ -161,101 +132,3 @@ class TestLLMPipelineE2E:
         )
         assert has_extraction, \
             "Extraction output should be displayed for Go Power bill"
-
-
-class TestTier4DirectExtraction:
-    """Direct tests of Tier 4 LLM extraction (not through UI).
-
-    These are E2E-marked because they call the real Gemini API
-    but don't need Streamlit.
-    """
-
-    @pytest.mark.skipif(not _has_gemini_key(), reason="GEMINI_API_KEY not set")
-    @pytest.mark.skipif(
-        not _bill_exists("sample_bill_photo.jpg"),
-        reason="Photo bill not found",
-    )
-    def test_photo_bill_extraction_quality(self):
-        """Verify LLM extracts meaningful data from a photographed bill."""
-        from llm_extraction import extract_tier4_llm
-
-        result = extract_tier4_llm(
-            _bill_path("sample_bill_photo.jpg"), is_image=True
-        )
-
-        # Should extract at least some fields from the photo
-        assert result.field_count >= 1, \
-            f"Expected at least 1 field from photo, got {result.field_count}"
-
-        # Some monetary field should be extractable from the photo
-        has_monetary = (
-            "total_incl_vat" in result.fields
-            or "subtotal" in result.fields
-        )
-        assert has_monetary, \
-            "At least subtotal or total should be extracted from photo bill"
-
-        # Value should be reasonable
-        monetary_field = result.fields.get("total_incl_vat") or result.fields.get("subtotal")
-        amount = float(monetary_field.value)
-        assert amount > 0, "Monetary amount should be positive"
-
-    @pytest.mark.skipif(not _has_gemini_key(), reason="GEMINI_API_KEY not set")
-    @pytest.mark.skipif(
-        not _bill_exists("094634_scan_14012026.pdf"),
-        reason="Scanned PDF not found",
-    )
-    def test_scanned_pdf_extraction(self):
-        """Verify LLM can extract from a scanned/degraded PDF."""
-        from llm_extraction import extract_tier4_llm
-
-        result = extract_tier4_llm(
-            _bill_path("094634_scan_14012026.pdf")
-        )
-
-        # Should extract at least some fields
-        assert result.field_count >= 1, \
-            f"Expected fields from scanned PDF, got {result.field_count}"
-
-    @pytest.mark.skipif(not _has_gemini_key(), reason="GEMINI_API_KEY not set")
-    @pytest.mark.skipif(
-        not _bill_exists("3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf"),
-        reason="Energia PDF not found",
-    )
-    def test_llm_agrees_with_regex_on_known_bill(self):
-        """LLM should agree with regex extraction on a well-formatted bill.
-
-        This is a quality check: for known bills where regex works well,
-        LLM should produce matching results.
-        """
-        from llm_extraction import extract_tier4_llm, _values_equivalent
-        from pipeline import extract_text_tier0, extract_tier2_universal
-
-        pdf_path = _bill_path(
-            "3 Energia 134 Bank Place (01.03.2025-31.03.2025).pdf"
-        )
-
-        # Get regex results
-        tier0 = extract_text_tier0(pdf_path)
-        regex_result = extract_tier2_universal(tier0.extracted_text)
-
-        # Get LLM results
-        llm_result = extract_tier4_llm(pdf_path)
-
-        # Check agreement on common fields
-        common_fields = set(regex_result.fields.keys()) & set(llm_result.fields.keys())
-        agreements = 0
-        total = len(common_fields)
-
-        for field_name in common_fields:
-            regex_val = regex_result.fields[field_name].value
-            llm_val = llm_result.fields[field_name].value
-            if _values_equivalent(regex_val, llm_val):
-                agreements += 1
-
-        # Expect at least 70% agreement on common fields
-        if total > 0:
-            agreement_rate = agreements / total
-            assert agreement_rate >= 0.70, \
-                f"LLM/regex agreement rate {agreement_rate:.0%} below 70% threshold. " \
-                f"Agreed on {agreements}/{total} fields."
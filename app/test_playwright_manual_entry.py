@@ -7,15 +7,15 @@ and detail view for manually entered fuel entries.
 import pytest
 from playwright.sync_api import Page, expect
 
-BASE_URL = "http://localhost:8601"
 BILL_EXTRACTOR_PATH = "/Bill_Extractor"
 
 pytestmark = pytest.mark.e2e
 
 
 @pytest.fixture(scope="module")
-def page_url():
-    return f"{BASE_URL}{BILL_EXTRACTOR_PATH}"
+def page_url(streamlit_app):
+    """The Bill Extractor on conftest.py's session-wide server."""
+    return f"{streamlit_app}{BILL_EXTRACTOR_PATH}"
 
 
 class TestManualEntryFormPresence:
@@ -20,8 +20,6 @@ Run this file directly:
     python3 -m pytest test_playwright_unified.py -v
 """
 import os
-import subprocess
-import time
 
 import pytest
 from playwright.sync_api import Page, expect
@@ -30,52 +28,17 @@ from playwright.sync_api import Page, expect
 pytestmark = pytest.mark.e2e
 
 APP_DIR = os.path.dirname(__file__)
-APP_PATH = os.path.join(APP_DIR, "main.py")
 BILLS_DIR = os.path.join(APP_DIR, "..", "sample_bills")
-STREAMLIT_PORT = 8597  # Unique port to avoid conflicts
-
-
-@pytest.fixture(scope="module")
-def streamlit_app():
-    """Start the Streamlit app as a subprocess and yield the URL."""
-    import sys
-    proc = subprocess.Popen(
-        [
-            sys.executable, "-m", "streamlit", "run", APP_PATH,
-            "--server.port", str(STREAMLIT_PORT),
-            "--server.headless", "true",
-            "--browser.gatherUsageStats", "false",
-        ],
-        cwd=APP_DIR,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-
-    url = f"http://localhost:{STREAMLIT_PORT}"
-
-    # Wait for Streamlit to be ready
-    import urllib.request
-    for _ in range(30):
-        try:
-            urllib.request.urlopen(url, timeout=2)
-            break
-        except Exception:
-            time.sleep(1)
-    else:
-        proc.terminate()
-        pytest.fail("Streamlit app did not start within 30 seconds")
-
-    yield url
-
-    proc.terminate()
-    proc.wait(timeout=10)
+
+
+# ``streamlit_app`` is the session-wide server fixture from conftest.py
+# (one server per xdist worker), and ``page`` is a fresh page per test.
 
 
 def _navigate_to_bill_extractor(page: Page, streamlit_app: str):
     """Navigate to the Bill Extractor page."""
-    page.goto(f"{streamlit_app}/Bill_Extractor")
-    page.wait_for_load_state("networkidle")
-    page.wait_for_timeout(3000)
+    page.goto(f"{streamlit_app}/Bill_Extractor", wait_until="domcontentloaded")
+    expect(page.locator('[data-testid="stFileUploader"]')).to_be_visible(timeout=15000)
 
 
 def _upload_pdf(page: Page, filename: str):
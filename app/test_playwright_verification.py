@@ -16,8 +16,6 @@ Run E2E tests explicitly:
     python3 -m pytest -m e2e test_playwright_verification.py -v
 """
 import os
-import subprocess
-import time
 
 import pytest
 from playwright.sync_api import Page, expect
@@ -26,55 +24,22 @@ from playwright.sync_api import Page, expect
 pytestmark = pytest.mark.e2e
 
 APP_DIR = os.path.dirname(__file__)
-APP_PATH = os.path.join(APP_DIR, "main.py")
 BILLS_DIR = os.path.join(APP_DIR, "..", "sample_bills")
 HDF_PATH = os.path.join(
     APP_DIR, "..", "HDF_calckWh_10306268587_03-02-2026.csv"
 )
-STREAMLIT_PORT = 8597  # Different port from other E2E tests
-
-
-@pytest.fixture(scope="module")
-def streamlit_app():
-    """Start the Streamlit app as a subprocess and yield the URL."""
-    import sys
-    proc = subprocess.Popen(
-        [
-            sys.executable, "-m", "streamlit", "run", APP_PATH,
-            "--server.port", str(STREAMLIT_PORT),
-            "--server.headless", "true",
-            "--browser.gatherUsageStats", "false",
-        ],
-        cwd=APP_DIR,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-
-    url = f"http://localhost:{STREAMLIT_PORT}"
-
-    # Wait for Streamlit to be ready
-    import urllib.request
-    for _ in range(30):
-        try:
-            urllib.request.urlopen(url, timeout=2)
-            break
-        except Exception:
-            time.sleep(1)
-    else:
-        proc.terminate()
-        pytest.fail("Streamlit app did not start within 30 seconds")
 
-    yield url
 
-    proc.terminate()
-    proc.wait(timeout=10)
+# ``streamlit_app`` is the session-wide server fixture from conftest.py
+# (one server per xdist worker), and ``page`` is a fresh page per test.
 
 
 def _navigate_to_meter_analysis(page: Page, streamlit_app: str):
     """Navigate to the Meter Analysis page."""
-    page.goto(f"{streamlit_app}/Meter_Analysis")
-    page.wait_for_load_state("networkidle")
-    page.wait_for_timeout(2000)
+    page.goto(f"{streamlit_app}/Meter_Analysis", wait_until="domcontentloaded")
+    expect(
+        page.locator('section[data-testid="stSidebar"] [data-testid="stFileUploader"]')
+    ).to_be_visible(timeout=15000)
 
 
 def _upload_hdf(page: Page):
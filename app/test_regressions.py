@@ -1,6 +1,7 @@
 import builtins
 import sys
 import types
+from datetime import date
 
 import pandas as pd
 
@@ -186,6 +187,15 @@ def test_short_year_date_parsing_supported():
     assert parsed_2.year == 2023
 
 
+def test_parse_bill_date_is_cached():
+    parse_formatter_date.cache_clear()
+    for _ in range(3):
+        assert parse_formatter_date("11 Apr 2025") == date(2025, 4, 11)
+    info = parse_formatter_date.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
 def test_spatial_ocr_uses_all_pages_by_default(monkeypatch):
     from spatial_extraction import get_ocr_dataframe
 
@@ -231,3 +241,27 @@ def test_spatial_ocr_uses_all_pages_by_default(monkeypatch):
     df, _avg_conf = get_ocr_dataframe("fake.pdf")
     assert len(df["page_num"].unique()) == 3
     assert "last_page" not in kwargs_seen
+
+
+def test_rotation_probe_runs_on_downscaled_copy():
+    from PIL import Image
+
+    from spatial_extraction import _ROTATION_PROBE_MAX_SIDE, _pick_best_rotation
+
+    img = Image.new("RGB", (4000, 3000), "white")
+    probe_sizes = []
+
+    def fake_image_to_string(candidate, lang):
+        probe_sizes.append(candidate.size)
+        # Only the 90° probe (portrait) reads like a bill
+        width, height = candidate.size
+        return "total vat account\nmprn" if height > width else ""
+
+    pytesseract_stub = types.SimpleNamespace(image_to_string=fake_image_to_string)
+
+    result = _pick_best_rotation(img, pytesseract_stub)
+
+    assert len(probe_sizes) == 4
+    assert all(max(size) <= _ROTATION_PROBE_MAX_SIDE for size in probe_sizes)
+    # The winning rotation is applied to the full-resolution image
+    assert result.size == (3000, 4000)